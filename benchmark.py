@@ -0,0 +1,148 @@
+import argparse
+import logging
+import statistics
+import time
+from datetime import date, timedelta
+from booking.models.search_parameters import SearchParameters
+from booking.services.booking import Booking
+from booking.utils.browser_factory import BrowserFactory
+from booking.utils.logging_config import LOG_LEVELS, configure_logging
+from booking.utils.lookup_cache import LookupCache
+from booking.utils.mock_site import MockBookingSite
+from booking.utils.rate_limiter import RateLimiter
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CITIES = ("Paris", "Rome", "Tokyo", "Lisbon", "Prague", "Vienna", "Madrid", "Berlin")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compare browser engines running the same searches against a local mock site"
+    )
+    parser.add_argument("--engines", nargs="+", default=["chrome", "firefox"],
+                        help="Browser engines to benchmark")
+    parser.add_argument("--searches", type=int, default=len(DEFAULT_CITIES),
+                        help="Number of generated searches to run per engine")
+    parser.add_argument("--searches-file",
+                        help="File with one SearchParameters JSON object per line, "
+                             "used instead of generated searches")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="WARNING",
+                        help="Root log level; repeated DEBUG messages are collapsed")
+    return parser.parse_args()
+
+
+def load_searches(args):
+    if args.searches_file:
+        with open(args.searches_file, encoding="utf-8") as searches:
+            return [SearchParameters.model_validate_json(line) for line in searches if line.strip()]
+
+    searches = []
+    for i in range(args.searches):
+        check_in = date.today() + timedelta(days=14 + 7 * i)
+        searches.append(SearchParameters(
+            city=DEFAULT_CITIES[i % len(DEFAULT_CITIES)],
+            check_in_date=check_in.isoformat(),
+            check_out_date=(check_in + timedelta(days=3)).isoformat(),
+            num_adults=2,
+            num_children=i % 2,
+            children_ages=[8] * (i % 2),
+            currency="USD" if i % 3 == 0 else None,
+        ))
+    return searches
+
+
+def browser_memory_mb(booking):
+    # Resident memory of the driver process and every browser process it spawned
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(booking.driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes) / (1024 * 1024)
+    except (AttributeError, psutil.Error):
+        return None
+
+
+def benchmark_engine(engine, searches, site, headless):
+    browser_service, browser_options = BrowserFactory().prepare_browser(
+        engine, detach=False, headless=headless
+    )
+
+    start = time.perf_counter()
+    with Booking(
+        browser_service,
+        browser_options,
+        teardown=True,
+        browser_type=engine,
+        base_url=site.base_url,
+        # Nothing to be polite to locally, and nothing learned should outlive the run
+        rate_limiter=RateLimiter(rate=1000, burst=1000, jitter=0),
+        lookup_cache=LookupCache(),
+    ) as booking:
+        startup = time.perf_counter() - start
+
+        latencies, ready_times, peak_memory = [], [], None
+        run_start = time.perf_counter()
+        for search_params in searches:
+            # Start every search with an empty cache so all of them take the full flow
+            booking.lookup_cache = LookupCache()
+            search_start = time.perf_counter()
+            metrics = booking.search_accommodation(search_params)
+            booking.collect_listings(search_params)
+            latencies.append(time.perf_counter() - search_start)
+            ready_times.append(metrics["time_to_ready"])
+
+            memory = browser_memory_mb(booking)
+            if memory is not None:
+                peak_memory = max(peak_memory or 0, memory)
+        total = time.perf_counter() - run_start
+
+    return {
+        "engine": engine,
+        "startup": startup,
+        "throughput": len(searches) / total * 60,
+        "p50": statistics.median(latencies),
+        "max": max(latencies),
+        "ready": statistics.mean(ready_times),
+        "memory": peak_memory,
+    }
+
+
+def print_report(results):
+    header = f"{'engine':<10}{'startup s':>11}{'searches/min':>14}{'p50 s':>9}{'max s':>9}{'ready s':>9}{'peak MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        memory = f"{result['memory']:.0f}" if result["memory"] is not None else "n/a"
+        print(
+            f"{result['engine']:<10}{result['startup']:>11.2f}{result['throughput']:>14.1f}"
+            f"{result['p50']:>9.2f}{result['max']:>9.2f}{result['ready']:>9.2f}{memory:>9}"
+        )
+    if psutil is None:
+        print("\nInstall psutil to measure browser memory.")
+
+
+def main():
+    args = parse_args()
+    configure_logging(getattr(logging, args.log_level))
+    searches = load_searches(args)
+
+    results = []
+    with MockBookingSite() as site:
+        for engine in args.engines:
+            print(f"Benchmarking {engine} with {len(searches)} searches...")
+            results.append(benchmark_engine(engine, searches, site, headless=not args.headed))
+
+    print()
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Vectorized price analytics over collected listings.
+
+Every function takes and returns pandas DataFrames and works column-wise, so
+summary tables over millions of listings never loop over rows in Python.
+Summaries group by currency as well, so prices in different currencies are
+never compared; run normalize_currency first to compare them all.
+"""
+
+import logging
+from typing import Dict, Iterable, Sequence
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+def listings_frame(results: Iterable[dict]) -> pd.DataFrame:
+    """
+    Build one frame of listings from finished job results.
+
+    Args:
+        results: Job results as stored by the broker, each with a 'listings' list
+
+    Returns:
+        DataFrame: One row per listing with parsed dates and compact dtypes
+    """
+    frame = pd.DataFrame.from_records(
+        [listing for result in results for listing in result.get("listings", [])],
+        columns=[
+            "city", "check_in_date", "check_out_date", "num_adults",
+            "num_children", "name", "price", "currency", "rating",
+        ],
+    )
+    frame["city"] = frame["city"].str.strip().str.title().astype("category")
+    frame["currency"] = frame["currency"].astype("category")
+    frame["check_in_date"] = pd.to_datetime(frame["check_in_date"])
+    frame["check_out_date"] = pd.to_datetime(frame["check_out_date"])
+    frame["price"] = frame["price"].astype("float64")
+    frame["rating"] = frame["rating"].astype("float64")
+    return frame
+
+
+def normalize_currency(frame: pd.DataFrame, rates: Dict[str, float], target: str) -> pd.DataFrame:
+    """
+    Convert all prices into one currency.
+
+    Args:
+        frame: Listings frame
+        rates: Value of one unit of each currency in the target currency
+        target: Code of the target currency
+
+    Returns:
+        DataFrame: Copy of the frame with prices in the target currency; rows in
+            currencies missing from rates are dropped
+    """
+    rates = {**rates, target: 1.0}
+    factors = frame["currency"].astype("object").map(rates).astype("float64")
+
+    unknown = factors.isna()
+    if unknown.any():
+        logger.warning(
+            "Dropping %s listings in currencies without a rate: %s",
+            int(unknown.sum()), sorted(frame.loc[unknown, "currency"].astype(str).unique()),
+        )
+
+    converted = frame.loc[~unknown].copy()
+    converted["price"] = converted["price"] * factors[~unknown]
+    converted["currency"] = pd.Categorical([target] * len(converted))
+    return converted
+
+
+def add_price_per_night(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add prices normalized by stay length and occupancy.
+
+    Adds 'nights', 'guests', 'price_per_night' and 'price_per_guest_night'.
+    """
+    frame = frame.copy()
+    frame["nights"] = (frame["check_out_date"] - frame["check_in_date"]).dt.days.clip(lower=1)
+    frame["guests"] = (frame["num_adults"] + frame["num_children"]).clip(lower=1)
+    frame["price_per_night"] = frame["price"] / frame["nights"]
+    frame["price_per_guest_night"] = frame["price_per_night"] / frame["guests"]
+    return frame
+
+
+def cheapest_stays(
+    frame: pd.DataFrame,
+    by: Sequence[str] = ("city", "check_in_date", "currency"),
+    price_column: str = "price_per_night",
+) -> pd.DataFrame:
+    """
+    Cheapest listing per city, check-in date and currency.
+
+    Returns:
+        DataFrame: One row per group
+    """
+    by = list(by)
+    return (
+        frame.dropna(subset=[price_column])
+        .sort_values(price_column, kind="stable")
+        .drop_duplicates(by)
+        .sort_values(by)
+        .reset_index(drop=True)
+    )
+
+
+def percentile_bands(
+    frame: pd.DataFrame,
+    by: Sequence[str] = ("city", "currency"),
+    price_column: str = "price_per_night",
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> pd.DataFrame:
+    """
+    Price percentiles per group.
+
+    Returns:
+        DataFrame: One row per group, one column per percentile (e.g. 'p50')
+            plus the listing count
+    """
+    grouped = frame.groupby(list(by), observed=True)[price_column]
+    bands = grouped.quantile(list(percentiles)).unstack()
+    bands.columns = [f"p{round(p * 100)}" for p in bands.columns]
+    bands["listings"] = grouped.count()
+    return bands.reset_index()
+
+
+def price_rating_frontier(
+    frame: pd.DataFrame,
+    by: Sequence[str] = ("city", "currency"),
+    price_column: str = "price_per_night",
+) -> pd.DataFrame:
+    """
+    Listings no other listing in the group beats on both price and rating.
+
+    Sorting by price and keeping each row whose rating exceeds the best rating
+    of all cheaper rows yields the Pareto frontier with one cumulative max.
+
+    Returns:
+        DataFrame: Frontier listings ordered by group and ascending price
+    """
+    by = list(by)
+    rated = frame.dropna(subset=[price_column, "rating"]).sort_values(
+        by + [price_column, "rating"], ascending=[True] * len(by) + [True, False], kind="stable"
+    )
+    best_cheaper = (
+        rated.groupby(by, observed=True)["rating"].cummax()
+        .groupby([rated[column] for column in by], observed=True).shift(fill_value=-np.inf)
+    )
+    return rated[rated["rating"] > best_cheaper].reset_index(drop=True)
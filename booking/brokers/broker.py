@@ -0,0 +1,92 @@
+"""
+Broker interface for distributing search jobs between workers.
+"""
+
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+import booking.constants as const
+from booking.models.search_job import SearchJob, search_key
+from booking.models.search_parameters import SearchParameters
+
+
+class Broker(ABC):
+    """
+    Queue of SearchJobs with at-least-once delivery.
+
+    A reserved job is hidden from other workers for the visibility timeout.
+    If it is neither acked nor released in time it becomes visible again and
+    is redelivered, up to CONFIG["RETRY_ATTEMPTS"] reservations in total.
+    Enqueuing a search whose key matches a pending job returns that job
+    instead of adding a duplicate. Jobs in higher-priority lanes are always
+    reserved first.
+    """
+
+    def __init__(self, max_attempts: int = const.CONFIG["RETRY_ATTEMPTS"]):
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def new_job(params: SearchParameters, lane: str) -> SearchJob:
+        return SearchJob(
+            id=uuid.uuid4().hex,
+            search_key=search_key(params),
+            lane=lane,
+            params=params,
+            enqueued_at=time.time(),
+        )
+
+    @abstractmethod
+    def enqueue(self, params: SearchParameters, lane: str = const.QUEUE_LANES[-1]) -> str:
+        """
+        Add a search to the queue.
+
+        Args:
+            params: Search to run
+            lane: Priority lane, one of QUEUE_LANES
+
+        Returns:
+            str: ID of the new job, or of the pending job with the same search key
+        """
+
+    @abstractmethod
+    def reserve(self, visibility_timeout: float = const.CONFIG["QUEUE_VISIBILITY_TIMEOUT"]) -> Optional[SearchJob]:
+        """
+        Take the next visible job, hiding it from other workers.
+
+        Args:
+            visibility_timeout: Seconds before the job is redelivered if not acked
+
+        Returns:
+            SearchJob: The reserved job carrying its receipt, or None if the queue is empty
+        """
+
+    @abstractmethod
+    def ack(self, job: SearchJob, result: dict) -> bool:
+        """
+        Mark a reserved job as done and store its result.
+
+        Returns:
+            bool: False if the reservation had already expired and the ack was ignored
+        """
+
+    @abstractmethod
+    def release(self, job: SearchJob, error: str, count_attempt: bool = True):
+        """
+        Give a reserved job back after a failure, failing it for good once
+        it has used up its attempts.
+
+        Args:
+            job: The reserved job
+            error: Description of the failure
+            count_attempt: False if the job itself did not fail (e.g. the
+                worker's browser died), so the reservation is not counted
+        """
+
+    @abstractmethod
+    def result(self, job_id: str) -> Optional[dict]:
+        """Return the stored result of a finished job, or None if it has not finished."""
+
+    @abstractmethod
+    def finished_results(self) -> Iterator[dict]:
+        """Yield the results of all finished jobs."""
@@ -0,0 +1,203 @@
+"""
+Filesystem-backed broker for running workers against a shared directory.
+
+Every state change is an atomic os.rename or os.link, so any number of
+worker processes can share the directory without extra locking:
+
+    queued/<priority>-<enqueued_ns>-<id>.json     jobs waiting to run
+    queued/<name>.<uuid>.promoting                jobs being moved to a more urgent lane
+    reserved/<deadline_ms>-<receipt>-<name>       jobs being worked on
+    done/<id>.json, failed/<id>.json              finished jobs
+    keys/<sha1 of search key>                     pending search keys
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Iterator, Optional
+import booking.constants as const
+from booking.brokers.broker import Broker
+from booking.models.search_job import SearchJob
+from booking.models.search_parameters import SearchParameters
+
+logger = logging.getLogger(__name__)
+
+STATES = ("queued", "reserved", "done", "failed", "keys")
+
+
+class FilesystemBroker(Broker):
+    def __init__(self, root: str, max_attempts: int = const.CONFIG["RETRY_ATTEMPTS"]):
+        super().__init__(max_attempts)
+        self.root = root
+        for state in STATES:
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+
+    def _path(self, state: str, name: str) -> str:
+        return os.path.join(self.root, state, name)
+
+    def _key_path(self, key: str) -> str:
+        return self._path("keys", hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def _write(path: str, data: dict):
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as job_file:
+            json.dump(data, job_file)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _read(path: str) -> dict:
+        with open(path, encoding="utf-8") as job_file:
+            return json.load(job_file)
+
+    def enqueue(self, params: SearchParameters, lane: str = const.QUEUE_LANES[-1]) -> str:
+        job = self.new_job(params, lane)
+        key_path = self._key_path(job.search_key)
+
+        while True:
+            # Link a complete key file into place, so a concurrent duplicate
+            # never sees the key without the job id in it
+            temp_path = f"{key_path}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as key_file:
+                key_file.write(job.id)
+            try:
+                os.link(temp_path, key_path)
+                break
+            except FileExistsError:
+                try:
+                    with open(key_path, encoding="utf-8") as key_file:
+                        existing_id = key_file.read()
+                except FileNotFoundError:
+                    # The pending job finished in the meantime
+                    continue
+                # Promote the pending duplicate if the new request is more urgent
+                self._promote(existing_id, job.lane)
+                logger.info("Search %s already pending as job %s", job.search_key, existing_id)
+                return existing_id
+            finally:
+                os.remove(temp_path)
+
+        name = f"{job.priority}-{time.time_ns():020d}-{job.id}.json"
+        self._write(self._path("queued", name), job.model_dump(mode="json"))
+        logger.info("Enqueued job %s in lane %s", job.id, job.lane)
+        return job.id
+
+    def _promote(self, job_id: str, lane: str):
+        priority = const.QUEUE_LANES.index(lane)
+        suffix = f"-{job_id}.json"
+        for name in os.listdir(os.path.join(self.root, "queued")):
+            if not name.endswith(suffix):
+                continue
+            current_priority, enqueued_ns, _ = name.split("-", 2)
+            if int(current_priority) <= priority:
+                return
+
+            # Hide the job while its lane is rewritten; if a worker took it first, it is running already
+            hidden_path = self._path("queued", f"{name}.{uuid.uuid4().hex}.promoting")
+            try:
+                os.rename(self._path("queued", name), hidden_path)
+            except FileNotFoundError:
+                return
+            data = self._read(hidden_path)
+            data["lane"] = lane
+            self._write(hidden_path, data)
+            os.rename(hidden_path, self._path("queued", f"{priority}-{enqueued_ns}-{job_id}.json"))
+            logger.info("Promoted job %s to lane %s", job_id, lane)
+            return
+
+    def _requeue_expired(self, now_ms: int):
+        for name in os.listdir(os.path.join(self.root, "reserved")):
+            if name.endswith(".tmp"):
+                continue
+            deadline, _, queued_name = name.split("-", 2)
+            if int(deadline) > now_ms:
+                continue
+
+            path = self._path("reserved", name)
+            try:
+                data = self._read(path)
+                if data["attempts"] >= self.max_attempts:
+                    self._finish(path, "failed", data, error="visibility timeout expired")
+                else:
+                    os.rename(path, self._path("queued", queued_name))
+            except FileNotFoundError:
+                # Another worker handled it first
+                continue
+
+    def reserve(self, visibility_timeout: float = const.CONFIG["QUEUE_VISIBILITY_TIMEOUT"]) -> Optional[SearchJob]:
+        now_ms = int(time.time() * 1000)
+        self._requeue_expired(now_ms)
+
+        deadline_ms = now_ms + int(visibility_timeout * 1000)
+        # Names sort by lane priority, then enqueue time
+        for name in sorted(os.listdir(os.path.join(self.root, "queued"))):
+            if not name.endswith(".json"):
+                continue
+            receipt = uuid.uuid4().hex
+            reserved_path = self._path("reserved", f"{deadline_ms:015d}-{receipt}-{name}")
+            try:
+                os.rename(self._path("queued", name), reserved_path)
+            except FileNotFoundError:
+                continue
+
+            data = self._read(reserved_path)
+            data["attempts"] += 1
+            self._write(reserved_path, data)
+            return SearchJob(**{**data, "receipt": receipt})
+
+        return None
+
+    def _find_reservation(self, job: SearchJob) -> Optional[str]:
+        suffix = f"-{job.id}.json"
+        for name in os.listdir(os.path.join(self.root, "reserved")):
+            if name.endswith(suffix) and name.split("-", 2)[1] == job.receipt:
+                return self._path("reserved", name)
+        return None
+
+    def _finish(self, reserved_path: str, state: str, data: dict, **fields):
+        self._write(self._path(state, f"{data['id']}.json"), {**data, **fields})
+        os.remove(reserved_path)
+        try:
+            os.remove(self._key_path(data["search_key"]))
+        except FileNotFoundError:
+            pass
+
+    def ack(self, job: SearchJob, result: dict) -> bool:
+        reserved_path = self._find_reservation(job)
+        if not reserved_path:
+            logger.warning("Ignoring ack for job %s: reservation expired", job.id)
+            return False
+
+        self._finish(reserved_path, "done", self._read(reserved_path), result=result)
+        return True
+
+    def release(self, job: SearchJob, error: str, count_attempt: bool = True):
+        reserved_path = self._find_reservation(job)
+        if not reserved_path:
+            return
+
+        data = self._read(reserved_path)
+        if count_attempt and data["attempts"] >= self.max_attempts:
+            self._finish(reserved_path, "failed", data, error=error)
+            return
+
+        if not count_attempt:
+            data["attempts"] -= 1
+            self._write(reserved_path, data)
+        queued_name = os.path.basename(reserved_path).split("-", 2)[2]
+        os.rename(reserved_path, self._path("queued", queued_name))
+
+    def result(self, job_id: str) -> Optional[dict]:
+        try:
+            return self._read(self._path("done", f"{job_id}.json"))["result"]
+        except FileNotFoundError:
+            return None
+
+    def finished_results(self) -> Iterator[dict]:
+        done_dir = os.path.join(self.root, "done")
+        for name in os.listdir(done_dir):
+            if name.endswith(".json"):
+                yield self._read(os.path.join(done_dir, name))["result"]
@@ -0,0 +1,184 @@
+"""
+SQLite-backed broker for running workers against a shared local database.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from typing import Iterator, Optional
+import booking.constants as const
+from booking.brokers.broker import Broker
+from booking.models.search_job import SearchJob
+from booking.models.search_parameters import SearchParameters
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    search_key TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    receipt TEXT,
+    result TEXT,
+    error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_pending_key
+    ON jobs (search_key) WHERE status IN ('queued', 'reserved');
+CREATE INDEX IF NOT EXISTS jobs_next
+    ON jobs (status, priority, enqueued_at);
+"""
+
+
+class SqliteBroker(Broker):
+    def __init__(self, path: str, max_attempts: int = const.CONFIG["RETRY_ATTEMPTS"]):
+        super().__init__(max_attempts)
+        self.path = path
+        connection = self._connect()
+        try:
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _transaction(self, work):
+        connection = self._connect()
+        try:
+            # Take the write lock up front so concurrent workers never reserve the same job
+            connection.execute("BEGIN IMMEDIATE")
+            result = work(connection)
+            connection.execute("COMMIT")
+            return result
+        except Exception:
+            # BEGIN itself may have failed, e.g. with "database is locked"
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def enqueue(self, params: SearchParameters, lane: str = const.QUEUE_LANES[-1]) -> str:
+        job = self.new_job(params, lane)
+
+        def insert(connection):
+            existing = connection.execute(
+                "SELECT id FROM jobs WHERE search_key = ? AND status IN ('queued', 'reserved')",
+                (job.search_key,),
+            ).fetchone()
+            if existing:
+                # Promote the pending duplicate if the new request is more urgent
+                connection.execute(
+                    "UPDATE jobs SET lane = ?, priority = ? WHERE id = ? AND priority > ?",
+                    (job.lane, job.priority, existing[0], job.priority),
+                )
+                logger.info("Search %s already pending as job %s", job.search_key, existing[0])
+                return existing[0]
+
+            connection.execute(
+                "INSERT INTO jobs (id, search_key, lane, priority, payload, status, "
+                "enqueued_at, visible_at) VALUES (?, ?, ?, ?, ?, 'queued', ?, ?)",
+                (job.id, job.search_key, job.lane, job.priority,
+                 job.params.model_dump_json(), job.enqueued_at, job.enqueued_at),
+            )
+            logger.info("Enqueued job %s in lane %s", job.id, job.lane)
+            return job.id
+
+        return self._transaction(insert)
+
+    def reserve(self, visibility_timeout: float = const.CONFIG["QUEUE_VISIBILITY_TIMEOUT"]) -> Optional[SearchJob]:
+        now = time.time()
+        receipt = uuid.uuid4().hex
+
+        def take(connection):
+            # Reservations that expired with no attempts left are failed, not redelivered
+            connection.execute(
+                "UPDATE jobs SET status = 'failed', error = 'visibility timeout expired', receipt = NULL "
+                "WHERE status = 'reserved' AND visible_at <= ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = connection.execute(
+                "SELECT id, search_key, lane, payload, attempts, enqueued_at FROM jobs "
+                "WHERE status IN ('queued', 'reserved') AND visible_at <= ? "
+                "ORDER BY priority, enqueued_at LIMIT 1",
+                (now,),
+            ).fetchone()
+            if not row:
+                return None
+
+            connection.execute(
+                "UPDATE jobs SET status = 'reserved', attempts = attempts + 1, "
+                "visible_at = ?, receipt = ? WHERE id = ?",
+                (now + visibility_timeout, receipt, row[0]),
+            )
+            return SearchJob(
+                id=row[0],
+                search_key=row[1],
+                lane=row[2],
+                params=SearchParameters.model_validate_json(row[3]),
+                attempts=row[4] + 1,
+                enqueued_at=row[5],
+                receipt=receipt,
+            )
+
+        return self._transaction(take)
+
+    def ack(self, job: SearchJob, result: dict) -> bool:
+        def complete(connection):
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'done', result = ?, receipt = NULL "
+                "WHERE id = ? AND receipt = ? AND status = 'reserved'",
+                (json.dumps(result), job.id, job.receipt),
+            )
+            return cursor.rowcount == 1
+
+        acked = self._transaction(complete)
+        if not acked:
+            logger.warning("Ignoring ack for job %s: reservation expired", job.id)
+        return acked
+
+    def release(self, job: SearchJob, error: str, count_attempt: bool = True):
+        def give_back(connection):
+            if not count_attempt:
+                connection.execute(
+                    "UPDATE jobs SET status = 'queued', attempts = attempts - 1, "
+                    "visible_at = ?, receipt = NULL, error = ? "
+                    "WHERE id = ? AND receipt = ? AND status = 'reserved'",
+                    (time.time(), error, job.id, job.receipt),
+                )
+                return
+            connection.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "visible_at = ?, receipt = NULL, error = ? "
+                "WHERE id = ? AND receipt = ? AND status = 'reserved'",
+                (self.max_attempts, time.time(), error, job.id, job.receipt),
+            )
+
+        self._transaction(give_back)
+
+    def result(self, job_id: str) -> Optional[dict]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT result FROM jobs WHERE id = ? AND status = 'done'", (job_id,)
+            ).fetchone()
+        finally:
+            connection.close()
+        return json.loads(row[0]) if row else None
+
+    def finished_results(self) -> Iterator[dict]:
+        connection = self._connect()
+        try:
+            for (result,) in connection.execute("SELECT result FROM jobs WHERE status = 'done'"):
+                yield json.loads(result)
+        finally:
+            connection.close()
@@ -1,5 +1,6 @@
 # Base URLs and endpoints
 BASE_URL = "https://www.booking.com"
+SEARCH_RESULTS_PATH = "/searchresults.html"
 
 # CSS and XPath Selectors
 SELECTORS = {
@@ -22,6 +23,13 @@ SELECTORS = {
     "ADULTS_INPUT": "group_adults",
     "CHILDREN_INPUT": "group_children",
     "KIDS_AGE_SELECT": '[data-testid="kids-ages-select"]',
+    
+    # Search results
+    "PROPERTY_CARD": '[data-testid="property-card"]',
+    "PROPERTY_PRICE": '[data-testid="price-and-discounted-price"]',
+    "PROPERTY_TITLE": '[data-testid="title"]',
+    "PROPERTY_RATING": '[data-testid="review-score"] > div:first-child',
+    "NO_RESULTS": '[data-testid="no-results-message"], [data-testid="sold-out-message"]',
 }
 
 # Configuration
@@ -31,4 +39,60 @@ CONFIG = {
     "WAIT_TIMEOUT": 10,          # Default wait timeout in seconds
     "DEFAULT_ADULTS": 1,         # Default number of adults
     "DEFAULT_CHILDREN": 0,       # Default number of children
+    "RATE_LIMIT_PER_SECOND": 0.5,  # Sustained navigations per second per host
+    "RATE_LIMIT_BURST": 1,       # Navigations allowed back to back before pacing
+    "RATE_LIMIT_JITTER": 0.5,    # Random extra delay as a fraction of the interval
+    "RATE_LIMIT_STATE_PATH": None,  # SQLite file to share the budget across processes on one host
+    "SLOW_RESPONSE_SECONDS": 8,  # Navigation latency that triggers a slowdown
+    "LOOKUP_CACHE_PATH": "booking_lookup_cache.db",  # SQLite file of learned currency/destination lookups
+    "RESULTS_POLL_INTERVAL": 0.1,  # Seconds between results-readiness checks
+    "RESULTS_QUIET_WINDOW_MS": 300,  # Listings must be unchanged this long to count as ready
+    "RESULTS_UNPRICED_GRACE_MS": 5000,  # How long cards without any price must stay unchanged
+    "QUEUE_VISIBILITY_TIMEOUT": 300,  # Seconds a reserved job stays hidden from other workers
+    "QUEUE_IDLE_SLEEP": 5,       # Seconds a worker waits when the queue is empty
+    "WORKER_MAX_CONSECUTIVE_FAILURES": 5,  # Failed jobs in a row before a worker stops
+    "LOG_FILE": "booking_automation.log",  # JSON log file
+    "LOG_REPEAT_BURST": 5,       # Identical DEBUG messages let through per interval
+    "LOG_REPEAT_INTERVAL": 10,   # Interval in seconds for the DEBUG repetition limit
+}
+
+# Work queue lanes, highest priority first
+QUEUE_LANES = ("interactive", "bulk")
+
+# Markers in WebDriver error messages that mean the browser session is gone
+SESSION_LOST_MARKERS = (
+    "invalid session id",
+    "not reachable",
+    "disconnected",
+    "session deleted",
+    "browsing context has been discarded",
+    "connection refused",
+    "max retries exceeded",
+)
+
+# Markers in the URL or page title that indicate a bot challenge page
+CHALLENGE_MARKERS = ("captcha", "challenge", "are you a robot")
+
+# Price symbols the site shows mapped to currency codes; bare "$" and "kr" are
+# ambiguous and left unmapped
+CURRENCY_SYMBOLS = {
+    "US$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "₪": "ILS",
+    "¥": "JPY",
+    "CN¥": "CNY",
+    "CA$": "CAD",
+    "AU$": "AUD",
+    "NZ$": "NZD",
+    "HK$": "HKD",
+    "S$": "SGD",
+    "R$": "BRL",
+    "MX$": "MXN",
+    "₹": "INR",
+    "₩": "KRW",
+    "฿": "THB",
+    "₺": "TRY",
+    "zł": "PLN",
+    "Kč": "CZK",
 }
\ No newline at end of file
@@ -0,0 +1,14 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class Listing(BaseModel):
+    city: str = Field(..., description="Destination city the search was for")
+    check_in_date: str = Field(..., description="Check-in date in YYYY-MM-DD format")
+    check_out_date: str = Field(..., description="Check-out date in YYYY-MM-DD format")
+    num_adults: int = Field(..., ge=1, description="Number of adults searched for")
+    num_children: int = Field(0, ge=0, description="Number of children searched for")
+    name: str = Field(..., description="Property name")
+    price: float = Field(..., ge=0, description="Total price of the stay")
+    currency: str = Field(..., description="Currency code of the price, or its symbol if the code is unknown")
+    rating: Optional[float] = Field(None, description="Review score out of 10")
@@ -0,0 +1,38 @@
+from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+import booking.constants as const
+from booking.models.search_parameters import SearchParameters
+from booking.utils.lookup_cache import normalize_city
+
+
+def search_key(params: SearchParameters) -> str:
+    """Key identifying searches that would return the same results."""
+    return "|".join([
+        normalize_city(params.city),
+        params.check_in_date,
+        params.check_out_date,
+        str(params.num_adults),
+        ",".join(str(age) for age in sorted(params.children_ages)),
+        (params.currency or "").upper(),
+    ])
+
+
+class SearchJob(BaseModel):
+    id: str = Field(..., description="Unique job identifier")
+    search_key: str = Field(..., description="Normalized key used for deduplication")
+    lane: str = Field(const.QUEUE_LANES[-1], description="Priority lane of the job")
+    params: SearchParameters = Field(..., description="Search to run")
+    attempts: int = Field(0, ge=0, description="Number of times the job was reserved")
+    enqueued_at: float = Field(..., description="Enqueue time as a UNIX timestamp")
+    receipt: Optional[str] = Field(None, description="Token of the current reservation")
+
+    @field_validator('lane')
+    @classmethod
+    def validate_lane(cls, v: str) -> str:
+        if v not in const.QUEUE_LANES:
+            raise ValueError(f"Unknown lane '{v}', expected one of {const.QUEUE_LANES}")
+        return v
+
+    @property
+    def priority(self) -> int:
+        return const.QUEUE_LANES.index(self.lane)
@@ -1,23 +1,45 @@
 import logging
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+import booking.constants as const
 from booking.models.search_parameters import SearchParameters
 from booking.services.booking_navigator import BookingNavigator
 from booking.services.date_picker import DatePicker
 from booking.services.occupancy_selector import OccupancySelector
+from booking.utils.logging_config import log_context, new_correlation_id
+from booking.utils.lookup_cache import LookupCache
 
 logger = logging.getLogger(__name__)
 
+DRIVERS = {
+    "chrome": webdriver.Chrome,
+    "firefox": webdriver.Firefox,
+}
+
 
 class Booking:
-    def __init__(self, browser_service, options=None, teardown=False):
-        self.driver = webdriver.Chrome(service=browser_service, options=options)
+    def __init__(self, browser_service=None, options=None, teardown=False, driver=None,
+                 rate_limiter=None, lookup_cache=None, browser_type="chrome",
+                 base_url=const.BASE_URL):
+        # An explicit driver (e.g. a RecordingDriver or ReplayDriver) takes precedence
+        if driver is None:
+            driver_class = DRIVERS.get(browser_type.lower())
+            if driver_class is None:
+                raise ValueError(f"Unsupported browser type: {browser_type}")
+            driver = driver_class(service=browser_service, options=options)
+        self.driver = driver
         self.teardown = teardown
         self.driver.maximize_window()
-        self.navigator = BookingNavigator(self.driver)
+        self.navigator = BookingNavigator(self.driver, rate_limiter, base_url)
         self.date_picker = DatePicker(self.driver)
         self.occupancy_selector = OccupancySelector(self.driver)
+        if lookup_cache is None:
+            lookup_cache = LookupCache(const.CONFIG["LOOKUP_CACHE_PATH"])
+        self.lookup_cache = lookup_cache
+        self.session_id = new_correlation_id()
         
-        logger.info("Booking service initialized")
+        with log_context(session_id=self.session_id):
+            logger.info("Booking service initialized")
         
     def __enter__(self):
         return self
@@ -27,15 +49,36 @@ class Booking:
             logger.info("Closing browser")
             self.driver.quit()
     
-    def search_accommodation(self, search_params: SearchParameters):
-        logger.info(f"Searching accommodations in {search_params.city}")
+    def search_accommodation(self, search_params: SearchParameters) -> dict:
+        # Returns the results-page readiness metrics of the search
+        with log_context(session_id=self.session_id, search_id=new_correlation_id()):
+            return self._search(search_params)
+    
+    def _search(self, search_params: SearchParameters) -> dict:
+        logger.info("Searching accommodations in %s", search_params.city)
+        
+        # Go straight to the results when the destination was resolved before
+        destination = self.lookup_cache.get_destination(search_params.city)
+        if destination:
+            metrics = self._open_cached_results(search_params, destination)
+            if metrics:
+                return metrics
+        
+        # Navigate to homepage, applying a known currency through the URL
+        currency = search_params.currency
+        known_currency = bool(currency) and self.lookup_cache.has_currency(currency)
+        self.navigator.go_to_home_page(currency if known_currency else None)
+        self._snapshot("home_page")
         
-        # Navigate to homepage
-        self.navigator.go_to_home_page()
+        if known_currency and not self.navigator.shows_currency(currency):
+            logger.warning("Site ignored currency %s in the URL", currency)
+            self.lookup_cache.forget_currency(currency)
+            known_currency = False
         
-        # Set currency if specified
-        if search_params.currency:
-            self.navigator.change_currency(search_params.currency)
+        # Set currency through the picker if specified and not seen before
+        if currency and not known_currency:
+            self.navigator.change_currency(currency)
+            self.lookup_cache.add_currency(currency)
             
         # Enter destination city
         self.navigator.search_city(search_params.city)
@@ -55,7 +98,56 @@ class Booking:
                 search_params.children_ages
             )
             
+        self._snapshot("search_form")
+        
         # Submit search
-        self.navigator.submit_search()
+        metrics = self.navigator.submit_search()
+        self._snapshot("search_results")
+        
+        resolved = self.navigator.resolved_destination()
+        if resolved:
+            self.lookup_cache.set_destination(
+                search_params.city, resolved["dest_id"], resolved["dest_type"]
+            )
         
-        logger.info("Search submitted successfully")
\ No newline at end of file
+        logger.info("Search submitted successfully")
+        return metrics
+    
+    def collect_listings(self, search_params: SearchParameters) -> list:
+        # Must be called after search_accommodation, while the results page is open
+        return self.navigator.results_page.collect_listings(search_params)
+    
+    def _open_cached_results(self, search_params: SearchParameters, destination: dict):
+        try:
+            metrics = self.navigator.open_search_results(search_params, destination)
+        except TimeoutException:
+            # A page that kept the destination accepted it and is just slow,
+            # so running the form again would not help
+            if self.navigator.resolved_destination():
+                raise
+            logger.warning("Cached destination for %s timed out", search_params.city)
+            self.lookup_cache.forget_destination(search_params.city)
+            return None
+        
+        # The site drops unknown destination ids from the URL, so treat that as stale
+        if not self.navigator.resolved_destination():
+            logger.warning("Cached destination for %s is stale", search_params.city)
+            self.lookup_cache.forget_destination(search_params.city)
+            return None
+        
+        # The currency only travels in the URL here, so fall back to the picker if it was ignored
+        currency = search_params.currency
+        if currency and not self.navigator.shows_currency(currency):
+            logger.warning("Site ignored currency %s on the cached results page", currency)
+            self.lookup_cache.forget_currency(currency)
+            return None
+        
+        self._snapshot("search_results")
+        logger.info("Search opened from cached destination")
+        return metrics
+    
+    def _snapshot(self, label: str):
+        # Only trace-aware drivers capture DOM snapshots
+        snapshot = getattr(self.driver, "snapshot", None)
+        if snapshot:
+            snapshot(label)
\ No newline at end of file
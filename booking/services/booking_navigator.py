@@ -1,35 +1,53 @@
 import logging
+import time
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import booking.constants as const
+from booking.models.search_parameters import SearchParameters
+from booking.services.results_page import ResultsPage
+from booking.utils.rate_limiter import RateLimiter, get_rate_limiter
+from booking.utils.waits import create_wait
 
 logger = logging.getLogger(__name__)
 
 
 class BookingNavigator:
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, rate_limiter: Optional[RateLimiter] = None,
+                 base_url: str = const.BASE_URL):
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
+        self.base_url = base_url
+        self.wait = create_wait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.results_page = ResultsPage(self.driver)
         
-    def go_to_home_page(self):
-        logger.info(f"Navigating to {const.BASE_URL}")
-        self.driver.get(const.BASE_URL)
+    def go_to_home_page(self, currency: Optional[str] = None):
+        url = self.base_url
+        if currency:
+            # The site accepts the currency as a query parameter, no picker needed
+            url = f"{url}?{urlencode({'selected_currency': currency})}"
+        logger.info("Navigating to %s", url)
         
-        # Wait for the page to load
-        try:
-            self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, const.SELECTORS["SEARCH_INPUT"])
-            ))
-            logger.info("Homepage loaded successfully")
-        except TimeoutException:
-            logger.error("Timeout waiting for homepage to load")
-            raise
+        def load_home_page():
+            self.driver.get(url)
+            
+            # Wait for the page to load
+            try:
+                self.wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, const.SELECTORS["SEARCH_INPUT"])
+                ))
+                logger.info("Homepage loaded successfully")
+            except TimeoutException:
+                logger.error("Timeout waiting for homepage to load")
+                raise
+        
+        self._paced_navigation(load_home_page)
     
     def change_currency(self, currency: str):
-        logger.info(f"Changing currency to {currency}")
+        logger.info("Changing currency to %s", currency)
         
         try:
             # Click on currency button
@@ -45,13 +63,24 @@ class BookingNavigator:
             ))
             currency_option.click()
             
-            logger.info(f"Currency changed to {currency}")
+            logger.info("Currency changed to %s", currency)
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to change currency: {e}")
+            logger.error("Failed to change currency: %s", e)
             raise
     
+    def shows_currency(self, currency: str) -> bool:
+        # The currency picker trigger shows the currency the page is using
+        try:
+            currency_button = self.wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, const.SELECTORS["CURRENCY_BUTTON"])
+            ))
+        except TimeoutException:
+            logger.warning("Currency picker not found")
+            return False
+        return currency.upper() in currency_button.text.upper()
+    
     def search_city(self, city: str):
-        logger.info(f"Entering city: {city}")
+        logger.info("Entering city: %s", city)
         
         try:
             search_input = self.wait.until(EC.element_to_be_clickable(
@@ -59,31 +88,88 @@ class BookingNavigator:
             ))
             search_input.clear()
             search_input.send_keys(city)
-            logger.info(f"City '{city}' entered successfully")
+            logger.info("City '%s' entered successfully", city)
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to enter city name: {e}")
+            logger.error("Failed to enter city name: %s", e)
             raise
     
-    def submit_search(self):
+    def submit_search(self) -> dict:
         logger.info("Submitting search")
         
+        def click_submit():
+            try:
+                search_box = self.wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, const.SELECTORS["SEARCH_BOX"])
+                ))
+                search_button = search_box.find_element(
+                    By.CSS_SELECTOR, "button[type='submit']"
+                )
+                started_at = time.perf_counter()
+                search_button.click()
+                
+                # Wait until the listings have actually rendered
+                metrics = self.results_page.wait_until_ready(started_at)
+                
+                logger.info("Search submitted successfully")
+                return metrics
+            except (TimeoutException, NoSuchElementException) as e:
+                logger.error("Failed to submit search: %s", e)
+                raise
+        
+        return self._paced_navigation(click_submit)
+    
+    def open_search_results(self, search_params: SearchParameters, destination: dict) -> dict:
+        # Load the results page straight from a previously resolved destination,
+        # skipping the currency picker, autocomplete, date picker and occupancy menu
+        query = [
+            ("ss", search_params.city),
+            ("dest_id", destination["dest_id"]),
+            ("dest_type", destination["dest_type"]),
+            ("checkin", search_params.check_in_date),
+            ("checkout", search_params.check_out_date),
+            ("group_adults", search_params.num_adults),
+            ("group_children", search_params.num_children),
+            ("no_rooms", 1),
+        ]
+        query.extend(("age", age) for age in search_params.children_ages)
+        if search_params.currency:
+            query.append(("selected_currency", search_params.currency))
+        url = f"{self.base_url}{const.SEARCH_RESULTS_PATH}?{urlencode(query)}"
+        
+        logger.info("Opening search results for %s directly", search_params.city)
+        
+        def load_results():
+            started_at = time.perf_counter()
+            self.driver.get(url)
+            return self.results_page.wait_until_ready(started_at)
+        
+        return self._paced_navigation(load_results)
+    
+    def resolved_destination(self) -> Optional[dict]:
+        # The results URL carries the destination the site resolved the city to
+        query = parse_qs(urlparse(self.driver.current_url).query)
+        if "dest_id" in query and "dest_type" in query:
+            return {"dest_id": query["dest_id"][0], "dest_type": query["dest_type"][0]}
+        return None
+    
+    def _paced_navigation(self, navigate):
+        # Every request that loads a page from the site goes through the shared limiter
+        self.rate_limiter.acquire(self.base_url)
+        start = time.perf_counter()
         try:
-            search_box = self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, const.SELECTORS["SEARCH_BOX"])
-            ))
-            search_button = search_box.find_element(
-                By.CSS_SELECTOR, "button[type='submit']"
-            )
-            search_button.click()
-            
-            # Wait for results page to start loading
-            self.wait.until(
-                lambda driver: driver.execute_script(
-                    "return document.readyState"
-                ) != "complete" or True
+            result = navigate()
+        except TimeoutException:
+            # A timed-out page load is the strongest slowdown signal we get
+            self.rate_limiter.record_response(
+                self.base_url, time.perf_counter() - start, challenged=self._is_challenge_page()
             )
-            
-            logger.info("Search submitted successfully")
-        except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to submit search: {e}")
-            raise
\ No newline at end of file
+            raise
+        latency = time.perf_counter() - start
+        self.rate_limiter.record_response(
+            self.base_url, latency, challenged=self._is_challenge_page()
+        )
+        return result
+    
+    def _is_challenge_page(self) -> bool:
+        page_marker = f"{self.driver.current_url} {self.driver.title}".lower()
+        return any(marker in page_marker for marker in const.CHALLENGE_MARKERS)
\ No newline at end of file
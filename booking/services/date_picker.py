@@ -2,10 +2,10 @@ import logging
 from datetime import datetime
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import booking.constants as const
+from booking.utils.waits import create_wait
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +13,10 @@ logger = logging.getLogger(__name__)
 class DatePicker:
     def __init__(self, driver: WebDriver):
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
+        self.wait = create_wait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
         
     def select_dates(self, check_in_date: str, check_out_date: str):
-        logger.info(f"Selecting dates: {check_in_date} to {check_out_date}")
+        logger.info("Selecting dates: %s to %s", check_in_date, check_out_date)
         
         try:
             # Open the date picker
@@ -32,7 +32,7 @@ class DatePicker:
                 (By.CSS_SELECTOR, check_in_selector)
             ))
             check_in_element.click()
-            logger.info(f"Check-in date {check_in_date} selected")
+            logger.info("Check-in date %s selected", check_in_date)
             
             # Navigate to and select check-out date
             self._navigate_to_date_month(check_out_date)
@@ -41,10 +41,10 @@ class DatePicker:
                 (By.CSS_SELECTOR, check_out_selector)
             ))
             check_out_element.click()
-            logger.info(f"Check-out date {check_out_date} selected")
+            logger.info("Check-out date %s selected", check_out_date)
             
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to select dates: {e}")
+            logger.error("Failed to select dates: %s", e)
             raise
     
     def _navigate_to_date_month(self, date_str: str) -> bool:
@@ -53,7 +53,7 @@ class DatePicker:
         year = date_obj.strftime('%Y')
         month_year = f"{month_name} {year}"
         
-        logger.info(f"Navigating to {month_year}")
+        logger.debug("Navigating to %s", month_year)
         
         try:
             # Find the calendar element
@@ -66,7 +66,7 @@ class DatePicker:
                 try:
                     month_xpath = const.SELECTORS["MONTH_HEADER"].format(month_year=month_year)
                     calendar.find_element(By.XPATH, month_xpath)
-                    logger.info(f"Found {month_year} in the calendar")
+                    logger.debug("Found %s in the calendar", month_year)
                     return True
                 except NoSuchElementException:
                     # Click next month if target month is not found
@@ -74,11 +74,11 @@ class DatePicker:
                         By.CSS_SELECTOR, const.SELECTORS["NEXT_MONTH_BUTTON"]
                     )
                     next_button.click()
-                    logger.debug(f"Clicked next month, looking for {month_year}")
+                    logger.debug("Clicked next month, looking for %s", month_year)
             
-            logger.warning(f"Could not find {month_year} after {const.CONFIG['MAX_MONTH_NAVIGATION']} attempts")
+            logger.warning("Could not find %s after %s attempts", month_year, const.CONFIG['MAX_MONTH_NAVIGATION'])
             return False
             
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Error navigating to month {month_year}: {e}")
+            logger.error("Error navigating to month %s: %s", month_year, e)
             raise
\ No newline at end of file
@@ -6,10 +6,10 @@ import logging
 from typing import List
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import booking.constants as const
+from booking.utils.waits import create_wait
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class OccupancySelector:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
+        self.wait = create_wait(self.driver, const.CONFIG["WAIT_TIMEOUT"])
     
     def open_occupancy_menu(self):
         """Open the occupancy configuration menu."""
@@ -39,7 +39,7 @@ class OccupancySelector:
             occupancy_element.click()
             logger.info("Occupancy menu opened")
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to open occupancy menu: {e}")
+            logger.error("Failed to open occupancy menu: %s", e)
             raise
     
     def set_adults(self, num_adults: int):
@@ -53,7 +53,7 @@ class OccupancySelector:
             logger.warning("Number of adults must be at least 1, setting to 1")
             num_adults = 1
             
-        logger.info(f"Setting number of adults to {num_adults}")
+        logger.info("Setting number of adults to %s", num_adults)
         
         try:
             # Open the occupancy menu
@@ -70,10 +70,10 @@ class OccupancySelector:
             for _ in range(num_adults - 1):
                 buttons["plus"].click()
                 
-            logger.info(f"Set adults to {num_adults}")
+            logger.info("Set adults to %s", num_adults)
             
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to set number of adults: {e}")
+            logger.error("Failed to set number of adults: %s", e)
             raise
     
     def set_children(self, num_children: int, ages: List[int]):
@@ -87,7 +87,7 @@ class OccupancySelector:
         if num_children != len(ages):
             raise ValueError(f"Number of children ({num_children}) doesn't match ages provided ({len(ages)})")
             
-        logger.info(f"Setting {num_children} children with ages {ages}")
+        logger.info("Setting %s children with ages %s", num_children, ages)
         
         try:
             # Occupancy menu should already be open from set_adults
@@ -113,10 +113,10 @@ class OccupancySelector:
             for i in range(num_children):
                 self._set_child_age(i, ages[i])
                 
-            logger.info(f"Successfully set {num_children} children with ages {ages}")
+            logger.info("Successfully set %s children with ages %s", num_children, ages)
             
         except (TimeoutException, NoSuchElementException) as e:
-            logger.error(f"Failed to set children: {e}")
+            logger.error("Failed to set children: %s", e)
             raise
     
     def _get_counter_buttons(self, input_id: str) -> dict:
@@ -155,7 +155,7 @@ class OccupancySelector:
                 break
                 
             if current_value < target_value:
-                logger.warning(f"Current value {current_value} is less than target {target_value}")
+                logger.warning("Current value %s is less than target %s", current_value, target_value)
                 break
                 
             minus_button.click()
@@ -169,7 +169,7 @@ class OccupancySelector:
             age: Age of the child (0-17)
         """
         if not 0 <= age <= 17:
-            logger.warning(f"Child age {age} is outside valid range (0-17), clamping to valid range")
+            logger.warning("Child age %s is outside valid range (0-17), clamping to valid range", age)
             age = max(0, min(age, 17))
             
         try:
@@ -193,8 +193,8 @@ class OccupancySelector:
                 select_element
             )
             
-            logger.info(f"Set age for child {index + 1} to {age}")
+            logger.info("Set age for child %s to %s", index + 1, age)
             
         except (NoSuchElementException, IndexError) as e:
-            logger.error(f"Failed to set age for child {index + 1}: {e}")
+            logger.error("Failed to set age for child %s: %s", index + 1, e)
             raise
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""
+Service for detecting when the search results page is ready on Booking.com
+and for collecting the listings it shows.
+"""
+
+import logging
+import re
+import time
+from typing import List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
+import booking.constants as const
+from booking.models.listing import Listing
+from booking.models.search_parameters import SearchParameters
+from booking.utils.waits import create_wait
+
+logger = logging.getLogger(__name__)
+
+# Installs a MutationObserver scoped to the listing cards on first call and
+# reports card/price counts, whether the page says nothing is available and
+# how long the listings have been quiet. Mutations outside the cards (ads,
+# banners, lazy images) are ignored.
+RESULTS_STATE_SCRIPT = """
+var cardSelector = arguments[0];
+var priceSelector = arguments[1];
+var emptySelector = arguments[2];
+if (location.pathname.indexOf('searchresults') === -1) {
+    return null;
+}
+var state = window.__bookingResultsState;
+if (!state) {
+    state = window.__bookingResultsState = {lastMutation: performance.now()};
+    var insideCard = function (node) {
+        if (node && node.nodeType !== 1) {
+            node = node.parentElement;
+        }
+        return !!node && node.closest(cardSelector) !== null;
+    };
+    var containsCard = function (node) {
+        return node.nodeType === 1 && (insideCard(node) || node.querySelector(cardSelector) !== null);
+    };
+    new MutationObserver(function (mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var mutation = mutations[i];
+            if (insideCard(mutation.target)) {
+                state.lastMutation = performance.now();
+                return;
+            }
+            for (var j = 0; j < mutation.addedNodes.length; j++) {
+                if (containsCard(mutation.addedNodes[j])) {
+                    state.lastMutation = performance.now();
+                    return;
+                }
+            }
+        }
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+}
+var cards = document.querySelectorAll(cardSelector);
+var priced = 0;
+for (var k = 0; k < cards.length; k++) {
+    if (cards[k].querySelector(priceSelector)) {
+        priced++;
+    }
+}
+return {
+    cards: cards.length,
+    priced: priced,
+    empty: document.querySelector(emptySelector) !== null,
+    quiet: performance.now() - state.lastMutation
+};
+"""
+
+# Reads every card in a single round trip instead of several commands per card
+LISTINGS_SCRIPT = """
+var selectors = arguments[0];
+var textOf = function (card, selector) {
+    var element = card.querySelector(selector);
+    return element ? element.textContent.trim() : null;
+};
+var cards = document.querySelectorAll(selectors.card);
+var listings = [];
+for (var i = 0; i < cards.length; i++) {
+    listings.push({
+        name: textOf(cards[i], selectors.title),
+        price: textOf(cards[i], selectors.price),
+        rating: textOf(cards[i], selectors.rating)
+    });
+}
+return listings;
+"""
+
+PRICE_PATTERN = re.compile(r"\d[\d,]*(?:\.\d+)?")
+RATING_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+
+class ResultsPage:
+    """
+    Detects when listing cards and their prices have rendered on the results page.
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize the results page service with a WebDriver instance.
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        self.driver = driver
+        self.wait = create_wait(
+            self.driver,
+            const.CONFIG["WAIT_TIMEOUT"],
+            poll_frequency=const.CONFIG["RESULTS_POLL_INTERVAL"],
+        )
+
+    def wait_until_ready(self, started_at: float) -> dict:
+        """
+        Block until the listings are rendered and have stopped changing.
+
+        The page counts as ready once the card and priced-card counts are
+        unchanged since the previous poll, at least one card shows a price and
+        no card has been mutated for the quiet window. Cards of sold-out
+        properties never get a price, so not every card has to be priced. A
+        page with cards but no prices only counts as ready if it shows the
+        no-availability message or stays unchanged for the longer unpriced
+        grace period. A page that states there are no results is ready with
+        no listings. Ads and images may still be loading.
+
+        Args:
+            started_at: time.perf_counter() value when the search was triggered
+
+        Returns:
+            dict: 'time_to_first_result' and 'time_to_ready' in seconds and
+                'listing_count'
+        """
+        metrics = {"time_to_first_result": None, "time_to_ready": None, "listing_count": 0}
+        previous_counts = [None]
+
+        def listings_settled(driver):
+            state = driver.execute_script(
+                RESULTS_STATE_SCRIPT,
+                const.SELECTORS["PROPERTY_CARD"],
+                const.SELECTORS["PROPERTY_PRICE"],
+                const.SELECTORS["NO_RESULTS"],
+            )
+            if not state or not (state["cards"] or state["empty"]):
+                return None
+
+            if state["cards"] and metrics["time_to_first_result"] is None:
+                metrics["time_to_first_result"] = time.perf_counter() - started_at
+
+            counts = (state["cards"], state["priced"])
+            counts_stable = counts == previous_counts[0]
+            previous_counts[0] = counts
+            if not counts_stable:
+                return None
+
+            # Prices may trail the cards by more than the quiet window
+            quiet_window = const.CONFIG["RESULTS_QUIET_WINDOW_MS"]
+            if state["cards"] and not state["priced"] and not state["empty"]:
+                quiet_window = const.CONFIG["RESULTS_UNPRICED_GRACE_MS"]
+            return state if state["quiet"] >= quiet_window else None
+
+        try:
+            state = self.wait.until(listings_settled)
+        except TimeoutException:
+            logger.error("Results did not settle, first result after %s", metrics["time_to_first_result"])
+            raise
+
+        metrics["listing_count"] = state["cards"]
+        metrics["time_to_ready"] = time.perf_counter() - started_at
+        if state["cards"]:
+            logger.info(
+                "Results ready: %s listings (%s priced), first result after %.2fs, ready after %.2fs",
+                state["cards"], state["priced"], metrics["time_to_first_result"], metrics["time_to_ready"],
+            )
+        else:
+            logger.info("Results ready: no availability, ready after %.2fs", metrics["time_to_ready"])
+        return metrics
+
+    def collect_listings(self, search_params: SearchParameters) -> List[Listing]:
+        """
+        Read name, price and rating of every listing card on the page.
+
+        Args:
+            search_params: Parameters of the search the page shows
+
+        Returns:
+            list: Listings with a parseable price
+        """
+        cards = self.driver.execute_script(LISTINGS_SCRIPT, {
+            "card": const.SELECTORS["PROPERTY_CARD"],
+            "title": const.SELECTORS["PROPERTY_TITLE"],
+            "price": const.SELECTORS["PROPERTY_PRICE"],
+            "rating": const.SELECTORS["PROPERTY_RATING"],
+        })
+
+        listings = []
+        for card in cards:
+            price = self._parse_price(card["price"])
+            if not card["name"] or price is None:
+                logger.debug("Skipping listing without name or price: %s", card)
+                continue
+
+            amount, symbol = price
+            listings.append(Listing(
+                city=search_params.city,
+                check_in_date=search_params.check_in_date,
+                check_out_date=search_params.check_out_date,
+                num_adults=search_params.num_adults,
+                num_children=search_params.num_children,
+                name=card["name"],
+                price=amount,
+                currency=self._listing_currency(symbol, search_params.currency),
+                rating=self._parse_rating(card["rating"]),
+            ))
+
+        logger.info("Collected %s of %s listings", len(listings), len(cards))
+        return listings
+
+    @staticmethod
+    def _parse_price(text: Optional[str]):
+        # Prices read like "US$1,234" or "€ 250"; the last number is the current price
+        if not text:
+            return None
+        amounts = PRICE_PATTERN.findall(text)
+        if not amounts:
+            return None
+        symbol = text[:text.index(amounts[0])].strip()
+        return float(amounts[-1].replace(",", "")), symbol
+
+    @classmethod
+    def _listing_currency(cls, symbol: str, requested: Optional[str]) -> str:
+        # The price shows what the site actually applied, which may differ from
+        # the request if the currency switch silently failed
+        code = cls._currency_code(symbol)
+        if code is None:
+            return requested.upper() if requested else symbol
+        if requested and code != requested.upper():
+            logger.warning("Prices are in %s although %s was requested", code, requested.upper())
+        return code
+
+    @staticmethod
+    def _currency_code(symbol: str) -> Optional[str]:
+        # Prices show symbols like "US$" or "€", or a plain code like "USD"
+        if symbol in const.CURRENCY_SYMBOLS:
+            return const.CURRENCY_SYMBOLS[symbol]
+        if re.fullmatch(r"[A-Za-z]{3}", symbol):
+            return symbol.upper()
+        logger.debug("No currency code known for price symbol %r", symbol)
+        return None
+
+    @staticmethod
+    def _parse_rating(text: Optional[str]) -> Optional[float]:
+        match = RATING_PATTERN.search(text or "")
+        return float(match.group()) if match else None
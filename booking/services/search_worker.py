@@ -0,0 +1,129 @@
+"""
+Worker that runs queued searches through a Booking instance.
+"""
+
+import logging
+import time
+from typing import Optional
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
+import booking.constants as const
+from booking.brokers.broker import Broker
+from booking.models.search_job import SearchJob
+from booking.services.booking import Booking
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerHalted(RuntimeError):
+    """Raised when a worker stops because it can no longer run searches."""
+
+
+def session_lost(error: Exception) -> bool:
+    """Whether the error means the worker's browser session is gone."""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in const.SESSION_LOST_MARKERS)
+
+
+class SearchWorker:
+    """
+    Pulls SearchJobs from a broker, runs them and pushes the results back.
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        booking: Booking,
+        visibility_timeout: float = const.CONFIG["QUEUE_VISIBILITY_TIMEOUT"],
+        idle_sleep: float = const.CONFIG["QUEUE_IDLE_SLEEP"],
+        max_consecutive_failures: int = const.CONFIG["WORKER_MAX_CONSECUTIVE_FAILURES"],
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            broker: Queue to pull jobs from
+            booking: Booking instance whose browser runs the searches
+            visibility_timeout: Seconds a job may run before it is redelivered
+            idle_sleep: Seconds to wait before polling an empty queue again
+            max_consecutive_failures: Failed jobs in a row after which the
+                worker stops instead of failing the rest of the queue
+        """
+        self.broker = broker
+        self.booking = booking
+        self.visibility_timeout = visibility_timeout
+        self.idle_sleep = idle_sleep
+        self.max_consecutive_failures = max_consecutive_failures
+
+    def run(self, max_jobs: Optional[int] = None, stop_when_idle: bool = False) -> int:
+        """
+        Process jobs until max_jobs have run or, optionally, the queue is empty.
+
+        Returns:
+            int: Number of jobs processed
+
+        Raises:
+            WorkerHalted: If the browser session died or too many jobs failed in a row
+        """
+        processed = 0
+        consecutive_failures = 0
+        while max_jobs is None or processed < max_jobs:
+            try:
+                job = self.broker.reserve(self.visibility_timeout)
+            except Exception as e:
+                # A busy or briefly unreachable queue must not end the worker
+                logger.error("Could not reserve a job: %s", e, exc_info=True)
+                time.sleep(self.idle_sleep)
+                continue
+            if job is None:
+                if stop_when_idle:
+                    break
+                time.sleep(self.idle_sleep)
+                continue
+
+            succeeded = self.process(job)
+            processed += 1
+            consecutive_failures = 0 if succeeded else consecutive_failures + 1
+            if consecutive_failures >= self.max_consecutive_failures:
+                # Something is wrong with this worker rather than with the jobs
+                raise WorkerHalted(f"{consecutive_failures} jobs failed in a row")
+
+        logger.info("Worker finished after %s jobs", processed)
+        return processed
+
+    def process(self, job: SearchJob) -> bool:
+        """
+        Run a single job and ack or release it.
+
+        Returns:
+            bool: True if the search succeeded
+
+        Raises:
+            WorkerHalted: If the browser session died; the job is given back
+                without counting the attempt
+        """
+        logger.info("Running job %s (attempt %s, lane %s)", job.id, job.attempts, job.lane)
+        try:
+            metrics = self.booking.search_accommodation(job.params)
+            listings = self.booking.collect_listings(job.params)
+            self.broker.ack(job, {
+                "metrics": metrics,
+                "url": self.booking.driver.current_url,
+                "listings": [listing.model_dump() for listing in listings],
+            })
+            return True
+        except Exception as e:
+            # Any failure, not just browser errors, must give the job back
+            # instead of hiding it until the visibility timeout
+            lost = session_lost(e)
+            logger.error("Job %s failed: %s", job.id, e, exc_info=True)
+            try:
+                self.broker.release(job, f"{type(e).__name__}: {e}", count_attempt=not lost)
+            except Exception:
+                logger.error("Could not release job %s, it is redelivered after the visibility timeout",
+                             job.id, exc_info=True)
+            if lost:
+                # Every further job would fail the same way and burn its attempts
+                raise WorkerHalted("Browser session lost") from e
+            return False
@@ -11,31 +11,67 @@ from webdriver_manager.firefox import GeckoDriverManager
 logger = logging.getLogger(__name__)
 
 
+# Equivalent lean profiles for both engines: no background networking,
+# telemetry, first-run UI, notifications or autoplaying media
+CHROME_LEAN_ARGUMENTS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--autoplay-policy=user-gesture-required",
+)
+
+FIREFOX_LEAN_PREFERENCES = {
+    "app.update.auto": False,
+    "app.update.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.page": 0,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "dom.webnotifications.enabled": False,
+    "extensions.update.enabled": False,
+    "media.autoplay.default": 5,
+    "network.prefetch-next": False,
+    "toolkit.telemetry.enabled": False,
+}
+
+
 class BrowserFactory:
-    def prepare_browser(self, browser_type, detach=True):
+    def prepare_browser(self, browser_type, detach=True, headless=False):
    
         browser_type = browser_type.lower()
         
         if browser_type == "chrome":
-            return self._prepare_chrome_browser(detach)
+            return self._prepare_chrome_browser(detach, headless)
         elif browser_type == "firefox":
-            return self._prepare_firefox_browser(detach)
+            return self._prepare_firefox_browser(detach, headless)
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
     
     
-    def _prepare_chrome_browser(self, detach=True):
+    def _prepare_chrome_browser(self, detach=True, headless=False):
         logger.info("Setting up Chrome browser")
         
         chrome_options = Options()
         if detach:
             chrome_options.add_experimental_option("detach", True)
         
+        # Don't block on images and ads; callers wait for the elements they need
+        chrome_options.page_load_strategy = "eager"
         chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-infobars")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        for argument in CHROME_LEAN_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        if headless:
+            chrome_options.add_argument("--headless=new")
         
         # Add option for Mac ARM64
         if platform.system() == 'Darwin' and platform.machine() == 'arm64':
@@ -48,21 +84,36 @@ class BrowserFactory:
             driver_path = ChromeDriverManager().install()
             os.chmod(driver_path, 0o755) 
             chrome_service = ChromeService(driver_path)
-            logger.info(f"ChromeDriver installed at: {driver_path}")
+            logger.info("ChromeDriver installed at: %s", driver_path)
         except Exception as e:
-            logger.error(f"Failed to set up ChromeDriver: {e}")
+            logger.error("Failed to set up ChromeDriver: %s", e)
             raise
             
         logger.info("Chrome browser setup completed")
         return chrome_service, chrome_options
     
     
-    def _prepare_firefox_browser(self, detach=True):
+    def _prepare_firefox_browser(self, detach=True, headless=False):
         logger.info("Setting up Firefox browser")
         
         firefox_options = FirefoxOptions()
-        firefox_options.add_argument("--start-maximized")
-        firefox_service = FirefoxService(GeckoDriverManager().install())
+        firefox_options.page_load_strategy = "eager"
+        # The window is maximized through WebDriver; Firefox has no --start-maximized
+        for name, value in FIREFOX_LEAN_PREFERENCES.items():
+            firefox_options.set_preference(name, value)
+        if headless:
+            firefox_options.add_argument("-headless")
+        if detach:
+            logger.info("Firefox does not support detaching, browser closes with the driver")
+        
+        # Install and set up GeckoDriver
+        try:
+            driver_path = GeckoDriverManager().install()
+            firefox_service = FirefoxService(driver_path)
+            logger.info("GeckoDriver installed at: %s", driver_path)
+        except Exception as e:
+            logger.error("Failed to set up GeckoDriver: %s", e)
+            raise
         
         logger.info("Firefox browser setup completed")
         return firefox_service, firefox_options
\ No newline at end of file
@@ -0,0 +1,377 @@
+"""
+Record-and-replay of WebDriver command traces.
+
+RecordingDriver wraps a live WebDriver and logs every command issued by the
+services (driver and element level) together with its duration. The trace can
+be saved to a JSON file and later fed to ReplayDriver, which answers the same
+commands from the file without a browser.
+
+Both drivers also hand out the waits the services poll with (see
+utils.waits). Recording notes where a wait timed out; replay polls without
+sleeping and raises the timeout at the same point, so the replay time only
+measures the Python side of the services.
+"""
+
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from selenium.common import exceptions as selenium_exceptions
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.wait import IGNORED_EXCEPTIONS, WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+TRACE_VERSION = 1
+DRIVER_TARGET = "driver"
+
+
+class TraceMismatchError(AssertionError):
+    """Raised when replayed code issues a command the trace does not expect."""
+
+
+class CommandTrace:
+    """
+    Ordered list of recorded WebDriver commands plus free-form metadata.
+    """
+
+    def __init__(self, commands: Optional[List[dict]] = None, metadata: Optional[dict] = None):
+        self.commands = commands if commands is not None else []
+        self.metadata = metadata if metadata is not None else {}
+
+    def append(self, entry: dict):
+        self.commands.append(entry)
+
+    def command_counts(self) -> Dict[str, int]:
+        """
+        Count recorded commands by name, ignoring DOM snapshots and wait timeouts.
+
+        Returns:
+            dict: Mapping of command name to number of calls
+        """
+        return dict(Counter(
+            entry["command"] for entry in self.commands if entry["kind"] in ("call", "attribute")
+        ))
+
+    def total_duration(self) -> float:
+        """Total time spent inside WebDriver commands while recording, in seconds."""
+        return sum(entry.get("duration", 0.0) for entry in self.commands)
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({
+                "version": TRACE_VERSION,
+                "metadata": self.metadata,
+                "commands": self.commands,
+            }, trace_file, indent=2)
+        logger.info("Saved trace with %s entries to %s", len(self.commands), path)
+
+    @classmethod
+    def load(cls, path: str) -> "CommandTrace":
+        with open(path, encoding="utf-8") as trace_file:
+            data = json.load(trace_file)
+
+        if data.get("version") != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version: {data.get('version')}")
+
+        logger.info("Loaded trace with %s entries from %s", len(data['commands']), path)
+        return cls(data["commands"], data.get("metadata", {}))
+
+
+class _Recorder:
+    """Shared state between a RecordingDriver and the elements it hands out."""
+
+    def __init__(self, trace: CommandTrace):
+        self.trace = trace
+        self.element_ids: Dict[str, str] = {}
+
+    def element_ref(self, element: WebElement) -> str:
+        # Selenium ids are session specific, so map them to stable sequential ids
+        if element.id not in self.element_ids:
+            self.element_ids[element.id] = f"e{len(self.element_ids)}"
+        return self.element_ids[element.id]
+
+    def serialize(self, value):
+        if isinstance(value, _RecordingElement):
+            value = value.wrapped
+        if isinstance(value, WebElement):
+            return {"element": self.element_ref(value)}
+        if isinstance(value, (list, tuple)):
+            return [self.serialize(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.serialize(item) for key, item in value.items()}
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        return repr(value)
+
+    def wrap(self, value):
+        if isinstance(value, WebElement):
+            return _RecordingElement(value, self)
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        return value
+
+    @staticmethod
+    def unwrap(value):
+        if isinstance(value, _RecordingElement):
+            return value.wrapped
+        if isinstance(value, (list, tuple)):
+            return type(value)(_Recorder.unwrap(item) for item in value)
+        return value
+
+    def attribute(self, target: str, wrapped, name: str):
+        value = getattr(wrapped, name)
+
+        if not callable(value):
+            self.trace.append({
+                "kind": "attribute",
+                "target": target,
+                "command": name,
+                "result": self.serialize(value),
+                "duration": 0.0,
+            })
+            return self.wrap(value)
+
+        def recorded_call(*args, **kwargs):
+            entry = {
+                "kind": "call",
+                "target": target,
+                "command": name,
+                "args": self.serialize(list(args)),
+                "kwargs": self.serialize(kwargs),
+            }
+            start = time.perf_counter()
+            try:
+                result = value(*self.unwrap(args), **{k: self.unwrap(v) for k, v in kwargs.items()})
+            except selenium_exceptions.WebDriverException as e:
+                entry["duration"] = time.perf_counter() - start
+                entry["error"] = type(e).__name__
+                entry["message"] = e.msg
+                self.trace.append(entry)
+                raise
+            entry["duration"] = time.perf_counter() - start
+            entry["result"] = self.serialize(result)
+            self.trace.append(entry)
+            return self.wrap(result)
+
+        return recorded_call
+
+
+class _RecordingWait(WebDriverWait):
+    """WebDriverWait that notes in the trace where it timed out."""
+
+    def __init__(self, driver: "RecordingDriver", timeout: float, poll_frequency: float):
+        super().__init__(driver, timeout, poll_frequency=poll_frequency)
+        self._trace = driver.trace
+
+    def until(self, method, message: str = ""):
+        try:
+            return super().until(method, message)
+        except TimeoutException:
+            self._trace.append({
+                "kind": "timeout",
+                "target": DRIVER_TARGET,
+                "command": "wait",
+                "duration": 0.0,
+            })
+            raise
+
+
+class _RecordingElement:
+    def __init__(self, wrapped: WebElement, recorder: _Recorder):
+        self.wrapped = wrapped
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return self._recorder.attribute(
+            self._recorder.element_ref(self.wrapped), self.wrapped, name
+        )
+
+
+class RecordingDriver:
+    """
+    Proxy around a live WebDriver that records every command into a trace.
+    """
+
+    def __init__(self, driver, trace: Optional[CommandTrace] = None):
+        self.wrapped = driver
+        self.trace = trace if trace is not None else CommandTrace()
+        self._recorder = _Recorder(self.trace)
+
+    def __getattr__(self, name):
+        return self._recorder.attribute(DRIVER_TARGET, self.wrapped, name)
+
+    def create_wait(self, timeout: float, poll_frequency: float) -> WebDriverWait:
+        return _RecordingWait(self, timeout, poll_frequency)
+
+    def snapshot(self, label: str):
+        """
+        Store the current DOM in the trace under the given label.
+
+        Args:
+            label: Name of the step the snapshot belongs to
+        """
+        self.trace.append({
+            "kind": "snapshot",
+            "target": DRIVER_TARGET,
+            "command": label,
+            "url": self.wrapped.current_url,
+            "dom": self.wrapped.page_source,
+        })
+
+
+class _ReplayElement:
+    def __init__(self, ref: str, player: "ReplayDriver"):
+        self.ref = ref
+        self._player = player
+
+    @property
+    def id(self):
+        return self.ref
+
+    def __getattr__(self, name):
+        return self._player._replay(self.ref, name)
+
+    def __eq__(self, other):
+        return isinstance(other, _ReplayElement) and other.ref == self.ref
+
+    def __hash__(self):
+        return hash(self.ref)
+
+
+class _ReplayWait:
+    """
+    Wait that polls a ReplayDriver back to back.
+
+    The trace already holds every poll the recorded wait made, so sleeping
+    between them would only measure the recorded poll count. A recorded
+    timeout is raised once replay reaches it.
+    """
+
+    def __init__(self, player: "ReplayDriver"):
+        self._player = player
+
+    def until(self, method, message: str = ""):
+        while not self._player._take_timeout():
+            try:
+                value = method(self._player)
+                if value:
+                    return value
+            except IGNORED_EXCEPTIONS:
+                pass
+        raise TimeoutException(message)
+
+
+class ReplayDriver:
+    """
+    Stand-in WebDriver that answers commands from a recorded trace.
+
+    Commands must arrive in the recorded order with the recorded arguments;
+    any divergence raises
+    TraceMismatchError so regressions in the command sequence fail loudly.
+    """
+
+    def __init__(self, trace: CommandTrace):
+        self.trace = trace
+        self._position = 0
+
+    @property
+    def remaining(self) -> int:
+        return len(self.trace.commands) - self._position
+
+    def __getattr__(self, name):
+        return self._replay(DRIVER_TARGET, name)
+
+    def create_wait(self, timeout: float, poll_frequency: float) -> _ReplayWait:
+        return _ReplayWait(self)
+
+    def snapshot(self, label: str):
+        entry = self._next(DRIVER_TARGET, label)
+        if entry["kind"] != "snapshot":
+            raise TraceMismatchError(f"Expected snapshot '{label}', trace has {entry['command']}")
+
+    def assert_exhausted(self):
+        if self.remaining:
+            entry = self.trace.commands[self._position]
+            raise TraceMismatchError(
+                f"{self.remaining} recorded commands were not replayed, next is "
+                f"{entry['target']}.{entry['command']}"
+            )
+
+    def _take_timeout(self) -> bool:
+        # Consume a recorded wait timeout if it is the next entry
+        if self._position < len(self.trace.commands):
+            if self.trace.commands[self._position]["kind"] == "timeout":
+                self._position += 1
+                return True
+        return False
+
+    def _next(self, target: str, name: str) -> dict:
+        if self._position >= len(self.trace.commands):
+            raise TraceMismatchError(f"Trace exhausted before {target}.{name}")
+
+        entry = self.trace.commands[self._position]
+        if entry["target"] != target or entry["command"] != name:
+            raise TraceMismatchError(
+                f"Command #{self._position}: expected {entry['target']}.{entry['command']}, "
+                f"got {target}.{name}"
+            )
+        self._position += 1
+        return entry
+
+    def _replay(self, target: str, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if self._position < len(self.trace.commands):
+            upcoming = self.trace.commands[self._position]
+            if upcoming["kind"] == "attribute" and upcoming["command"] == name:
+                return self._result(self._next(target, name))
+
+        def replayed_call(*args, **kwargs):
+            entry = self._next(target, name)
+            self._check_arguments(entry, list(args), kwargs)
+            if "error" in entry:
+                exception_class = getattr(
+                    selenium_exceptions, entry["error"], selenium_exceptions.WebDriverException
+                )
+                raise exception_class(entry.get("message"))
+            return self._result(entry)
+
+        return replayed_call
+
+    def _check_arguments(self, entry: dict, args: list, kwargs: dict):
+        # Selectors, URLs and script arguments must match what was recorded
+        recorded = (entry.get("args", []), entry.get("kwargs", {}))
+        replayed = (self._serialize(args), self._serialize(kwargs))
+        if replayed != recorded:
+            raise TraceMismatchError(
+                f"Command #{self._position - 1} {entry['target']}.{entry['command']}: "
+                f"expected arguments {recorded}, got {replayed}"
+            )
+
+    def _serialize(self, value):
+        # Mirrors _Recorder.serialize, after a JSON round trip
+        if isinstance(value, _ReplayElement):
+            return {"element": value.ref}
+        if isinstance(value, (list, tuple)):
+            return [self._serialize(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._serialize(item) for key, item in value.items()}
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        return repr(value)
+
+    def _result(self, entry: dict):
+        return self._deserialize(entry.get("result"))
+
+    def _deserialize(self, value: Any):
+        if isinstance(value, dict) and set(value) == {"element"}:
+            return _ReplayElement(value["element"], self)
+        if isinstance(value, list):
+            return [self._deserialize(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._deserialize(item) for key, item in value.items()}
+        return value
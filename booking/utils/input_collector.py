@@ -32,17 +32,17 @@ class UserInputCollector:
         
         try:
             search_params = SearchParameters(**params)
-            logger.info(f"Created validated search parameters: {search_params.model_dump()}")
+            logger.info("Created validated search parameters: %s", search_params.model_dump())
             return search_params
         except ValidationError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             raise
     
     def _get_city_name(self):
         while True:
             city = input("Enter city name: ").strip()
             if city:
-                logger.info(f"City name entered: {city}")
+                logger.info("City name entered: %s", city)
                 return city
             print("City name cannot be empty. Please try again.")
     
@@ -59,7 +59,7 @@ class UserInputCollector:
                     print("Check-in date cannot be in the past.")
                     continue
                 
-                logger.info(f"Check-in date entered: {check_in_date}")
+                logger.info("Check-in date entered: %s", check_in_date)
                 return check_in_date
             except ValueError:
                 print("Invalid date format. Please use YYYY-MM-DD format.")
@@ -78,7 +78,7 @@ class UserInputCollector:
                     print("Check-out date must be after check-in date.")
                     continue
                 
-                logger.info(f"Check-out date entered: {check_out_date}")
+                logger.info("Check-out date entered: %s", check_out_date)
                 return check_out_date
             except ValueError:
                 print("Invalid date format. Please use YYYY-MM-DD format.")
@@ -88,7 +88,7 @@ class UserInputCollector:
             try:
                 num_adults = int(input("Enter number of adults: ").strip())
                 if num_adults > 0:
-                    logger.info(f"Number of adults entered: {num_adults}")
+                    logger.info("Number of adults entered: %s", num_adults)
                     return num_adults
                 print("Number of adults must be greater than 0.")
             except ValueError:
@@ -99,7 +99,7 @@ class UserInputCollector:
             try:
                 num_children = int(input("Enter number of children (0-17 years old): ").strip())
                 if num_children >= 0:
-                    logger.info(f"Number of children entered: {num_children}")
+                    logger.info("Number of children entered: %s", num_children)
                     return num_children
                 print("Number of children cannot be negative.")
             except ValueError:
@@ -122,14 +122,14 @@ class UserInputCollector:
                     except ValueError:
                         print("Please enter a valid number.")
         
-        logger.info(f"Children ages entered: {children_ages}")
+        logger.info("Children ages entered: %s", children_ages)
         return children_ages
     
     def _get_currency(self):
         currency = input("Enter currency code (e.g., USD, EUR) or press Enter for default: ").strip().upper()
         
         if currency:
-            logger.info(f"Currency entered: {currency}")
+            logger.info("Currency entered: %s", currency)
             return currency
             
         logger.info("Using default currency")
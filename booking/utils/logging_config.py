@@ -0,0 +1,192 @@
+"""
+Non-blocking, structured logging setup.
+
+Log calls only enqueue the record; a background QueueListener thread does the
+message formatting and the file/console I/O. Records carry the session and
+search correlation IDs of the context they were logged from, and repetitive
+DEBUG messages are rate limited before they ever reach the queue.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+import booking.constants as const
+
+_session_id: contextvars.ContextVar = contextvars.ContextVar("session_id", default=None)
+_search_id: contextvars.ContextVar = contextvars.ContextVar("search_id", default=None)
+
+CONSOLE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(search_id)s] %(message)s"
+
+# Level names accepted by the --log-level option of the entry points
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+@contextmanager
+def log_context(session_id: Optional[str] = None, search_id: Optional[str] = None):
+    """
+    Tag every record logged inside the block with the given correlation IDs.
+
+    Args:
+        session_id: ID of the browser session, kept from the outer context if None
+        search_id: ID of the search, kept from the outer context if None
+    """
+    tokens = []
+    if session_id is not None:
+        tokens.append((_session_id, _session_id.set(session_id)))
+    if search_id is not None:
+        tokens.append((_search_id, _search_id.set(search_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """Attach the current session and search IDs to each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id = _session_id.get()
+        record.search_id = _search_id.get()
+        return True
+
+
+class RepetitionFilter(logging.Filter):
+    """
+    Rate limit repetitive low-level messages.
+
+    Records at or below `level` are grouped by logger, call site and message
+    template; at most `burst` of each group pass per `interval` seconds. The
+    next record let through reports how many were suppressed.
+    """
+
+    def __init__(self, burst: int, interval: float, level: int = logging.DEBUG):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.level = level
+        self._lock = threading.Lock()
+        self._windows: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+
+        key = (record.name, record.lineno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            # [window start, records passed in window, records suppressed]
+            window = self._windows.setdefault(key, [now, 0, 0])
+            if now - window[0] >= self.interval:
+                window[0], window[1] = now, 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                return False
+            window[1] += 1
+            record.suppressed = window[2]
+            window[2] = 0
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "session_id": getattr(record, "session_id", None),
+            "search_id": getattr(record, "search_id", None),
+            "thread": record.threadName,
+        }
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _LazyQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock handler formats the message in the caller's thread; keep
+        # the raw msg/args so formatting happens on the listener thread instead
+        return record
+
+
+class _StoppableQueueListener(QueueListener):
+    """QueueListener that may be stopped more than once, e.g. by its caller and again at exit."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.running = False
+
+    def start(self):
+        super().start()
+        self.running = True
+
+    def stop(self):
+        # Flushes whatever is still queued the first time only
+        if self.running:
+            self.running = False
+            super().stop()
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    log_file: Optional[str] = const.CONFIG["LOG_FILE"],
+    console: bool = True,
+) -> QueueListener:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    Args:
+        level: Root log level
+        log_file: File receiving JSON records, or None to disable
+        console: Whether to also log human-readable lines to stderr
+
+    Returns:
+        QueueListener: The running listener, stopped automatically at exit
+    """
+    handlers = []
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _LazyQueueHandler(log_queue)
+    queue_handler.addFilter(RepetitionFilter(
+        const.CONFIG["LOG_REPEAT_BURST"], const.CONFIG["LOG_REPEAT_INTERVAL"]
+    ))
+    queue_handler.addFilter(CorrelationFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = _StoppableQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,141 @@
+"""
+Persistent cache of currency and destination lookups learned from earlier runs.
+"""
+
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS currencies (
+    code TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS destinations (
+    city TEXT PRIMARY KEY,
+    dest_id TEXT NOT NULL,
+    dest_type TEXT NOT NULL
+);
+"""
+
+
+def normalize_city(city: str) -> str:
+    """Normalize free-text city input so that 'new  York ' and 'New York' share an entry."""
+    return " ".join(city.split()).casefold()
+
+
+class LookupCache:
+    """
+    Remembers currencies the site applied from the URL and the destinations
+    city names resolved to.
+
+    With a path the entries live in a SQLite file that every process using it
+    reads and writes directly, so concurrent workers learn from each other and
+    never overwrite each other's entries. Without a path they live in memory.
+    The cache only saves work, so database errors are logged and treated as misses.
+    """
+
+    def __init__(self, path: Optional[str] = None, entries: Optional[dict] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file to share entries through, or None for an in-memory cache
+            entries: Initial entries in the format returned by entries_for
+        """
+        self.path = path
+        self._currencies: Set[str] = set()
+        self._destinations: Dict[str, dict] = {}
+
+        if path:
+            connection = self._connect()
+            try:
+                connection.executescript(SCHEMA)
+            except sqlite3.Error as e:
+                logger.warning("Lookup cache %s is unusable: %s", path, e)
+            finally:
+                connection.close()
+
+        if entries:
+            for currency in entries.get("currencies", []):
+                self.add_currency(currency)
+            for city, destination in entries.get("destinations", {}).items():
+                self.set_destination(city, destination["dest_id"], destination["dest_type"])
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        connection = self._connect()
+        try:
+            return connection.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Lookup cache %s query failed: %s", self.path, e)
+            return []
+        finally:
+            connection.close()
+
+    def has_currency(self, currency: str) -> bool:
+        """Whether the site applied this currency from the URL before."""
+        code = currency.upper()
+        if not self.path:
+            return code in self._currencies
+        return bool(self._execute("SELECT 1 FROM currencies WHERE code = ?", (code,)))
+
+    def add_currency(self, currency: str):
+        code = currency.upper()
+        if not self.path:
+            self._currencies.add(code)
+            return
+        self._execute("INSERT OR IGNORE INTO currencies (code) VALUES (?)", (code,))
+
+    def forget_currency(self, currency: str):
+        code = currency.upper()
+        if not self.path:
+            self._currencies.discard(code)
+            return
+        self._execute("DELETE FROM currencies WHERE code = ?", (code,))
+
+    def get_destination(self, city: str) -> Optional[dict]:
+        """
+        Look up a previously resolved destination.
+
+        Args:
+            city: City name as entered by the user
+
+        Returns:
+            dict: 'dest_id' and 'dest_type' of the destination, or None if unknown
+        """
+        key = normalize_city(city)
+        if not self.path:
+            return self._destinations.get(key)
+        rows = self._execute("SELECT dest_id, dest_type FROM destinations WHERE city = ?", (key,))
+        return {"dest_id": rows[0][0], "dest_type": rows[0][1]} if rows else None
+
+    def set_destination(self, city: str, dest_id: str, dest_type: str):
+        key = normalize_city(city)
+        if not self.path:
+            self._destinations[key] = {"dest_id": dest_id, "dest_type": dest_type}
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO destinations (city, dest_id, dest_type) VALUES (?, ?, ?)",
+            (key, dest_id, dest_type),
+        )
+
+    def forget_destination(self, city: str):
+        key = normalize_city(city)
+        if not self.path:
+            self._destinations.pop(key, None)
+            return
+        self._execute("DELETE FROM destinations WHERE city = ?", (key,))
+
+    def entries_for(self, city: str, currency: Optional[str] = None) -> dict:
+        """Return the subset of entries a search for the given city and currency would use."""
+        entries = {"currencies": [], "destinations": {}}
+        destination = self.get_destination(city)
+        if destination:
+            entries["destinations"][normalize_city(city)] = destination
+        if currency and self.has_currency(currency):
+            entries["currencies"].append(currency.upper())
+        return entries
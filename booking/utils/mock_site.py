@@ -0,0 +1,292 @@
+"""
+Local stand-in for the Booking.com pages the services drive.
+
+The pages expose the same selectors as the real site (see SELECTORS) so the
+unmodified services can run a full search against it without network access.
+The results page renders its listing cards and prices asynchronously and keeps
+mutating an ad banner, like the real page does.
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+import booking.constants as const
+
+logger = logging.getLogger(__name__)
+
+HOME_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<title>Mock Booking</title>
+<style>.hidden { display: none; } span[data-date] { padding: 2px; }</style>
+</head>
+<body>
+<button type="button" data-testid="header-currency-picker-trigger" id="currency-trigger">EUR</button>
+<div id="currency-list" class="hidden"></div>
+<div data-testid="searchbox-layout-wide">
+<form id="search-form">
+  <input name="ss" id="ss" autocomplete="off">
+  <div data-testid="searchbox-dates-container" id="dates">Check-in - Check-out</div>
+  <div data-testid="searchbox-datepicker-calendar" id="calendar" class="hidden">
+    <button type="button" aria-label="Next month" id="next-month">&gt;</button>
+    <div id="months"></div>
+  </div>
+  <div data-testid="occupancy-config" id="occupancy">Guests</div>
+  <div id="occupancy-menu" class="hidden">
+    <div><button type="button" data-step="-1" data-for="group_adults">-</button><input id="group_adults" value="2" readonly><button type="button" data-step="1" data-for="group_adults">+</button></div>
+    <div><button type="button" data-step="-1" data-for="group_children">-</button><input id="group_children" value="0" readonly><button type="button" data-step="1" data-for="group_children">+</button></div>
+    <div id="kids-ages"></div>
+  </div>
+  <button type="submit">Search</button>
+</form>
+</div>
+<script>
+var MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+              'August', 'September', 'October', 'November', 'December'];
+var query = new URLSearchParams(location.search);
+var state = {currency: query.get('selected_currency') || 'EUR', checkin: null, checkout: null, offset: 0};
+var byId = function (id) { return document.getElementById(id); };
+var pad = function (n) { return (n < 10 ? '0' : '') + n; };
+
+byId('currency-trigger').textContent = state.currency;
+byId('currency-trigger').onclick = function () {
+  var list = byId('currency-list');
+  list.innerHTML = '';
+  ['EUR', 'USD', 'GBP', 'ILS', 'JPY'].forEach(function (code) {
+    var button = document.createElement('button');
+    var label = document.createElement('div');
+    button.type = 'button';
+    label.className = 'CurrencyPicker_currency';
+    label.textContent = code;
+    button.appendChild(label);
+    button.onclick = function () {
+      state.currency = code;
+      byId('currency-trigger').textContent = code;
+      list.classList.add('hidden');
+    };
+    list.appendChild(button);
+  });
+  list.classList.remove('hidden');
+};
+
+function renderMonths() {
+  var now = new Date();
+  var html = '';
+  for (var i = 0; i < 2; i++) {
+    var first = new Date(now.getFullYear(), now.getMonth() + state.offset + i, 1);
+    var year = first.getFullYear(), month = first.getMonth();
+    var days = new Date(year, month + 1, 0).getDate();
+    html += '<div><h3>' + MONTHS[month] + ' ' + year + '</h3>';
+    for (var day = 1; day <= days; day++) {
+      html += '<span data-date="' + year + '-' + pad(month + 1) + '-' + pad(day) + '">' + day + '</span>';
+    }
+    html += '</div>';
+  }
+  byId('months').innerHTML = html;
+}
+
+byId('dates').onclick = function () {
+  renderMonths();
+  byId('calendar').classList.remove('hidden');
+};
+byId('next-month').onclick = function () {
+  state.offset++;
+  renderMonths();
+};
+byId('months').onclick = function (event) {
+  var date = event.target.getAttribute('data-date');
+  if (!date) {
+    return;
+  }
+  if (!state.checkin || state.checkout) {
+    state.checkin = date;
+    state.checkout = null;
+  } else {
+    state.checkout = date;
+    byId('calendar').classList.add('hidden');
+  }
+};
+
+function renderKidsAges() {
+  var container = byId('kids-ages');
+  var count = parseInt(byId('group_children').value, 10);
+  while (container.children.length > count) {
+    container.removeChild(container.lastChild);
+  }
+  while (container.children.length < count) {
+    var wrapper = document.createElement('div');
+    var select = document.createElement('select');
+    wrapper.setAttribute('data-testid', 'kids-ages-select');
+    for (var age = 0; age <= 17; age++) {
+      var option = document.createElement('option');
+      option.value = age;
+      option.textContent = age;
+      select.appendChild(option);
+    }
+    wrapper.appendChild(select);
+    container.appendChild(wrapper);
+  }
+}
+
+byId('occupancy').onclick = function () {
+  byId('occupancy-menu').classList.toggle('hidden');
+};
+byId('occupancy-menu').onclick = function (event) {
+  var step = event.target.getAttribute('data-step');
+  if (!step) {
+    return;
+  }
+  var input = byId(event.target.getAttribute('data-for'));
+  var minimum = input.id === 'group_adults' ? 1 : 0;
+  input.value = Math.max(minimum, parseInt(input.value, 10) + parseInt(step, 10));
+  if (input.id === 'group_children') {
+    renderKidsAges();
+  }
+};
+
+byId('search-form').onsubmit = function (event) {
+  event.preventDefault();
+  var city = byId('ss').value;
+  var hash = 0;
+  for (var i = 0; i < city.length; i++) {
+    hash = (hash * 31 + city.toLowerCase().charCodeAt(i)) % 1000000;
+  }
+  var params = new URLSearchParams();
+  params.set('ss', city);
+  params.set('dest_id', '-' + hash);
+  params.set('dest_type', 'city');
+  params.set('checkin', state.checkin || '');
+  params.set('checkout', state.checkout || '');
+  params.set('group_adults', byId('group_adults').value);
+  params.set('group_children', byId('group_children').value);
+  params.set('no_rooms', '1');
+  document.querySelectorAll('[data-testid="kids-ages-select"] select').forEach(function (select) {
+    params.append('age', select.value);
+  });
+  params.set('selected_currency', state.currency);
+  location.href = '__RESULTS_PATH__?' + params.toString();
+};
+</script>
+</body>
+</html>
+"""
+
+RESULTS_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Mock Booking results</title></head>
+<body>
+<div id="ad-banner">Ad</div>
+<div id="results"></div>
+<script>
+var query = new URLSearchParams(location.search);
+var city = query.get('ss') || '';
+var currency = query.get('selected_currency') || 'EUR';
+var seed = 0;
+for (var i = 0; i < city.length; i++) {
+  seed = (seed * 31 + city.charCodeAt(i)) % 100000;
+}
+
+// Ads keep changing long after the listings are ready
+var ticks = 0;
+setInterval(function () {
+  document.getElementById('ad-banner').textContent = 'Ad ' + (++ticks);
+}, 50);
+
+// Cards arrive first, prices are filled in shortly after
+setTimeout(function () {
+  var results = document.getElementById('results');
+  for (var i = 0; i < __LISTING_COUNT__; i++) {
+    var card = document.createElement('div');
+    card.setAttribute('data-testid', 'property-card');
+    card.innerHTML = '<div data-testid="title">' + city + ' Hotel ' + (i + 1) + '</div>' +
+      '<div data-testid="review-score"><div>' + (5 + (seed + i * 7) % 50 / 10).toFixed(1) + '</div></div>';
+    results.appendChild(card);
+  }
+  if (!results.children.length) {
+    results.innerHTML = '<div data-testid="no-results-message">No properties found</div>';
+  }
+  setTimeout(function () {
+    var cards = document.querySelectorAll('[data-testid="property-card"]');
+    for (var i = 0; i < cards.length; i++) {
+      var price = document.createElement('span');
+      price.setAttribute('data-testid', 'price-and-discounted-price');
+      price.textContent = currency + ' ' + (80 + (seed + i * 53) % 400);
+      cards[i].appendChild(price);
+    }
+  }, __PRICE_DELAY_MS__);
+}, __CARD_DELAY_MS__);
+</script>
+</body>
+</html>
+"""
+
+
+class MockBookingSite:
+    """
+    Serves the mock pages from a background thread on a free local port.
+
+    Usage:
+        with MockBookingSite() as site:
+            Booking(..., base_url=site.base_url)
+    """
+
+    def __init__(self, listing_count: int = 25, card_delay_ms: int = 200, price_delay_ms: int = 150):
+        """
+        Initialize the mock site.
+
+        Args:
+            listing_count: Number of listing cards on every results page
+            card_delay_ms: Delay before the results page renders its cards
+            price_delay_ms: Further delay before prices appear on the cards
+        """
+        pages = {
+            "/": HOME_PAGE.replace("__RESULTS_PATH__", const.SEARCH_RESULTS_PATH),
+            const.SEARCH_RESULTS_PATH: (
+                RESULTS_PAGE
+                .replace("__LISTING_COUNT__", str(listing_count))
+                .replace("__CARD_DELAY_MS__", str(card_delay_ms))
+                .replace("__PRICE_DELAY_MS__", str(price_delay_ms))
+            ),
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                page = pages.get(urlparse(self.path).path)
+                if page is None:
+                    self.send_error(404)
+                    return
+                body = page.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Mock site: " + format, *args)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Mock site serving at %s", self.base_url)
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
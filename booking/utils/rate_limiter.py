@@ -0,0 +1,237 @@
+"""
+Token-bucket rate limiter shared by all outbound navigations.
+
+Each host gets its own bucket. Buckets live either in process memory (shared
+across threads and asyncio tasks) or in a SQLite file so that several worker
+processes draw from the same budget. The effective rate adapts to the target
+site: it is cut when responses slow down or a challenge page is detected and
+recovers gradually while responses stay healthy.
+"""
+
+import asyncio
+import logging
+import random
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+import booking.constants as const
+
+logger = logging.getLogger(__name__)
+
+MIN_RATE_FACTOR = 0.05       # Never throttle below 5% of the configured rate
+RECOVERY_STEP = 0.05         # Additive recovery per healthy response
+SLOWDOWN_FACTOR = 0.5        # Multiplicative cut for slow responses
+CHALLENGE_FACTOR = 0.25      # Multiplicative cut when a challenge page is seen
+
+
+class _MemoryStore:
+    """Bucket state shared between threads of a single process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, dict] = {}
+
+    def update(self, host: str, initial: dict, func: Callable[[dict], float]) -> float:
+        with self._lock:
+            state = self._states.setdefault(host, dict(initial))
+            return func(state)
+
+
+class _SqliteStore:
+    """Bucket state shared between processes through a SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "host TEXT PRIMARY KEY, tokens REAL, updated_at REAL, rate_factor REAL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def update(self, host: str, initial: dict, func: Callable[[dict], float]) -> float:
+        connection = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock up front, serialising all processes
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT tokens, updated_at, rate_factor FROM buckets WHERE host = ?", (host,)
+            ).fetchone()
+            if row:
+                state = {"tokens": row[0], "updated_at": row[1], "rate_factor": row[2]}
+            else:
+                state = dict(initial)
+
+            result = func(state)
+
+            connection.execute(
+                "INSERT OR REPLACE INTO buckets (host, tokens, updated_at, rate_factor) "
+                "VALUES (?, ?, ?, ?)",
+                (host, state["tokens"], state["updated_at"], state["rate_factor"]),
+            )
+            connection.execute("COMMIT")
+            return result
+        except Exception:
+            # BEGIN itself may have failed, e.g. with "database is locked"
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+
+class RateLimiter:
+    """
+    Per-host token bucket with jittered pacing and adaptive backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = const.CONFIG["RATE_LIMIT_PER_SECOND"],
+        burst: float = const.CONFIG["RATE_LIMIT_BURST"],
+        jitter: float = const.CONFIG["RATE_LIMIT_JITTER"],
+        slow_response: float = const.CONFIG["SLOW_RESPONSE_SECONDS"],
+        host_rates: Optional[Dict[str, float]] = None,
+        state_path: Optional[str] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Sustained requests per second allowed per host
+            burst: Bucket capacity, i.e. how many requests may go out back to back
+            jitter: Extra random delay as a fraction of the request interval
+            slow_response: Response latency in seconds that triggers a slowdown
+            host_rates: Optional per-host overrides of the sustained rate
+            state_path: SQLite file for sharing buckets between processes on
+                one host; processes on other hosts keep their own budget
+        """
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.slow_response = slow_response
+        self.host_rates = host_rates or {}
+        self.state_path = state_path
+        self._store = _SqliteStore(state_path) if state_path else _MemoryStore()
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        return urlparse(url_or_host).netloc or url_or_host
+
+    def _host_rate(self, host: str) -> float:
+        return self.host_rates.get(host, self.rate)
+
+    def _reserve(self, host: str) -> float:
+        rate = self._host_rate(host)
+        now = time.time()
+
+        def take_token(state: dict) -> float:
+            effective_rate = rate * state["rate_factor"]
+            elapsed = max(0.0, now - state["updated_at"])
+            state["tokens"] = min(self.burst, state["tokens"] + elapsed * effective_rate)
+            state["updated_at"] = now
+            # Tokens may go negative: the caller then owns a slot in the future,
+            # which keeps concurrent callers evenly spaced instead of stampeding
+            state["tokens"] -= 1
+            if state["tokens"] >= 0:
+                return 0.0
+            return -state["tokens"] / effective_rate
+
+        delay = self._store.update(
+            host, {"tokens": self.burst, "updated_at": now, "rate_factor": 1.0}, take_token
+        )
+        if self.jitter:
+            delay += random.uniform(0, self.jitter / rate)
+        return delay
+
+    def acquire(self, url_or_host: str) -> float:
+        """
+        Block until a request to the host is allowed.
+
+        Args:
+            url_or_host: URL or host name of the request
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        host = self.host_of(url_or_host)
+        delay = self._reserve(host)
+        if delay > 0:
+            logger.debug("Rate limiting %s: waiting %.2fs", host, delay)
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url_or_host: str) -> float:
+        """Asyncio variant of acquire that does not block the event loop."""
+        host = self.host_of(url_or_host)
+        if isinstance(self._store, _SqliteStore):
+            # Taking the SQLite write lock can block for up to the busy timeout
+            loop = asyncio.get_running_loop()
+            delay = await loop.run_in_executor(None, self._reserve, host)
+        else:
+            delay = self._reserve(host)
+        if delay > 0:
+            logger.debug("Rate limiting %s: waiting %.2fs", host, delay)
+            await asyncio.sleep(delay)
+        return delay
+
+    def record_response(self, url_or_host: str, latency: float, challenged: bool = False):
+        """
+        Adapt the host's rate to how the site responded.
+
+        Args:
+            url_or_host: URL or host name of the request
+            latency: Time the navigation took in seconds
+            challenged: Whether a captcha or challenge page was returned
+        """
+        host = self.host_of(url_or_host)
+        now = time.time()
+
+        def adapt(state: dict) -> float:
+            if challenged:
+                state["rate_factor"] = max(MIN_RATE_FACTOR, state["rate_factor"] * CHALLENGE_FACTOR)
+                # Drain the bucket so the next request waits a full interval
+                state["tokens"] = min(state["tokens"], 0.0)
+            elif latency > self.slow_response:
+                state["rate_factor"] = max(MIN_RATE_FACTOR, state["rate_factor"] * SLOWDOWN_FACTOR)
+            else:
+                state["rate_factor"] = min(1.0, state["rate_factor"] + RECOVERY_STEP)
+            return state["rate_factor"]
+
+        factor = self._store.update(
+            host, {"tokens": self.burst, "updated_at": now, "rate_factor": 1.0}, adapt
+        )
+        if challenged:
+            logger.warning("Challenge page detected on %s, rate cut to %.0f%%", host, factor * 100)
+        elif latency > self.slow_response:
+            logger.warning("Slow response from %s (%.1fs), rate cut to %.0f%%", host, latency, factor * 100)
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter(state_path: Optional[str] = None) -> RateLimiter:
+    """
+    Return the process-wide rate limiter, creating it from CONFIG on first use.
+
+    Args:
+        state_path: SQLite file shared with the other processes on this host,
+            defaulting to CONFIG["RATE_LIMIT_STATE_PATH"]; only used when the
+            limiter is created
+    """
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(
+                state_path=state_path or const.CONFIG["RATE_LIMIT_STATE_PATH"]
+            )
+        elif state_path and state_path != _default_limiter.state_path:
+            raise ValueError(
+                f"Rate limiter already uses {_default_limiter.state_path!r}, not {state_path!r}"
+            )
+        return _default_limiter
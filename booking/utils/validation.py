@@ -8,14 +8,14 @@ logger = logging.getLogger(__name__)
 def validate_date_format(date_str):
     pattern = r'^\d{4}-\d{2}-\d{2}$'
     if not re.match(pattern, date_str):
-        logger.warning(f"Date string '{date_str}' does not match YYYY-MM-DD pattern")
+        logger.warning("Date string '%s' does not match YYYY-MM-DD pattern", date_str)
         return False
     
     try:
         datetime.strptime(date_str, '%Y-%m-%d')
         return True
     except ValueError as e:
-        logger.warning(f"Date validation failed for '{date_str}': {e}")
+        logger.warning("Date validation failed for '%s': %s", date_str, e)
         return False
 
 
@@ -25,7 +25,7 @@ def validate_date_sequence(check_in, check_out):
         check_out_date = datetime.strptime(check_out, '%Y-%m-%d')
         return check_out_date > check_in_date
     except ValueError as e:
-        logger.warning(f"Date sequence validation failed: {e}")
+        logger.warning("Date sequence validation failed: %s", e)
         return False
 
 
@@ -35,7 +35,7 @@ def validate_date_not_in_past(date_str):
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         return date >= today
     except ValueError as e:
-        logger.warning(f"Date validation failed: {e}")
+        logger.warning("Date validation failed: %s", e)
         return False
     
     
@@ -44,5 +44,5 @@ def validate_child_age(age):
         age_int = int(age)
         return 0 <= age_int <= 17
     except (ValueError, TypeError):
-        logger.warning(f"Child age validation failed for '{age}'")
+        logger.warning("Child age validation failed for '%s'", age)
         return False
\ No newline at end of file
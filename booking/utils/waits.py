@@ -0,0 +1,28 @@
+"""
+Factory for the waits the services poll the page with.
+"""
+
+from selenium.webdriver.support.wait import POLL_FREQUENCY, WebDriverWait
+import booking.constants as const
+
+
+def create_wait(driver, timeout: float = const.CONFIG["WAIT_TIMEOUT"],
+                poll_frequency: float = POLL_FREQUENCY):
+    """
+    Create a wait for the given driver.
+
+    Trace-aware drivers (see command_trace) supply their own wait so that
+    timeouts are recorded and replay polls without sleeping.
+
+    Args:
+        driver: WebDriver, RecordingDriver or ReplayDriver
+        timeout: Seconds before the wait raises TimeoutException
+        poll_frequency: Seconds to sleep between polls
+
+    Returns:
+        WebDriverWait: Wait whose until() polls the driver
+    """
+    factory = getattr(driver, "create_wait", None)
+    if factory:
+        return factory(timeout, poll_frequency)
+    return WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
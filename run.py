@@ -1,22 +1,66 @@
+import argparse
 import logging
+import time
+from booking.models.search_parameters import SearchParameters
 from booking.utils.browser_factory import BrowserFactory
 from booking.utils.input_collector import UserInputCollector
-from booking.services.booking import Booking
+from booking.services.booking import Booking, DRIVERS
+from booking.utils.command_trace import CommandTrace, RecordingDriver, ReplayDriver
+from booking.utils.logging_config import LOG_LEVELS, configure_logging
+from booking.utils.lookup_cache import LookupCache
+from booking.utils.rate_limiter import RateLimiter
+import booking.constants as const
 from selenium.common.exceptions import WebDriverException
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("booking_automation.log"),
-        logging.StreamHandler()
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Booking.com accommodation search")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", metavar="TRACE",
+                      help="Record WebDriver commands and DOM snapshots to a trace file")
+    mode.add_argument("--replay", metavar="TRACE",
+                      help="Replay a recorded trace without a browser")
+    parser.add_argument("--browser", choices=sorted(DRIVERS), default="chrome",
+                        help="Browser engine to run the search in")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO",
+                        help="Root log level; repeated DEBUG messages are collapsed")
+    return parser.parse_args()
+
+
+def replay(trace_path):
+    trace = CommandTrace.load(trace_path)
+    # Recorded dates may be in the past by now, so skip validation
+    search_params = SearchParameters.model_construct(**trace.metadata["search_parameters"])
+    driver = ReplayDriver(trace)
+    # Use the cache entries seen while recording so replay takes the same path
+    lookup_cache = LookupCache(entries=trace.metadata.get("lookup_cache", {}))
+    
+    # Nothing is sent to the site, so pacing would only inflate the measured overhead
+    rate_limiter = RateLimiter(rate=1000, burst=1000, jitter=0)
+    
+    start = time.perf_counter()
+    with Booking(driver=driver, rate_limiter=rate_limiter, lookup_cache=lookup_cache) as booking:
+        booking.search_accommodation(search_params)
+    elapsed = time.perf_counter() - start
+    driver.assert_exhausted()
+    
+    logger.info("Replayed %s trace entries in %.4fs (recorded driver time %.4fs)",
+                len(trace.commands), elapsed, trace.total_duration())
+    for command, count in sorted(trace.command_counts().items()):
+        print(f"{command}: {count}")
+
+
 def main():
+    args = parse_args()
+    configure_logging(getattr(logging, args.log_level))
+    
+    if args.replay:
+        # Let replay failures propagate so CI sees a non-zero exit
+        replay(args.replay)
+        return
+    
     try:
         # Get user input for search parameters
         collector = UserInputCollector()
@@ -24,25 +68,40 @@ def main():
         
         # Setup browser using the factory
         browser_factory = BrowserFactory()
-        browser_service, browser_options = browser_factory.prepare_browser("chrome")
+        browser_service, browser_options = browser_factory.prepare_browser(args.browser)
         
-        logger.info(f"Starting search for accommodations in {search_params.city}")
+        logger.info("Starting search for accommodations in %s", search_params.city)
         
         # Initialize the booking automation and perform search
-        with Booking(browser_service, browser_options) as booking:
-            booking.search_accommodation(search_params)
+        if args.record:
+            lookup_cache = LookupCache(const.CONFIG["LOOKUP_CACHE_PATH"])
+            trace = CommandTrace(metadata={
+                "search_parameters": search_params.model_dump(),
+                "lookup_cache": lookup_cache.entries_for(search_params.city, search_params.currency),
+            })
+            driver = RecordingDriver(
+                DRIVERS[args.browser](service=browser_service, options=browser_options), trace
+            )
+            try:
+                with Booking(driver=driver, lookup_cache=lookup_cache) as booking:
+                    booking.search_accommodation(search_params)
+            finally:
+                trace.save(args.record)
+        else:
+            with Booking(browser_service, browser_options, browser_type=args.browser) as booking:
+                booking.search_accommodation(search_params)
             
     except WebDriverException as e:
-        logger.error(f"WebDriver error: {e}")
+        logger.error("WebDriver error: %s", e)
         print("\nBrowser automation failed. Please try again.")
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         print(f"\nInput validation failed: {e}")
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
         print("\nProcess interrupted. Exiting...")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"\nAn unexpected error occurred: {e}")
 
 
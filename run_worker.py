@@ -0,0 +1,121 @@
+import argparse
+import json
+import logging
+import os
+import sys
+from booking.brokers.filesystem_broker import FilesystemBroker
+from booking.brokers.sqlite_broker import SqliteBroker
+from booking.models.search_parameters import SearchParameters
+from booking.services.booking import Booking, DRIVERS
+from booking.services.search_worker import SearchWorker, WorkerHalted
+from booking.utils.browser_factory import BrowserFactory
+from booking.utils.logging_config import LOG_LEVELS, configure_logging
+from booking.utils.rate_limiter import get_rate_limiter
+import booking.constants as const
+
+logger = logging.getLogger(__name__)
+
+
+def make_broker(spec):
+    # Broker specs look like "sqlite:jobs.db" or "fs:/shared/queue"
+    kind, _, location = spec.partition(":")
+    if kind == "sqlite":
+        return SqliteBroker(location)
+    elif kind == "fs":
+        return FilesystemBroker(location)
+    else:
+        raise ValueError(f"Unsupported broker: {spec}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Distributed Booking.com search worker")
+    parser.add_argument("--broker", required=True,
+                        help="Job queue, e.g. sqlite:jobs.db or fs:/shared/queue")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO",
+                        help="Root log level; repeated DEBUG messages are collapsed")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    work = commands.add_parser("work", help="Run queued searches")
+    work.add_argument("--browser", choices=sorted(DRIVERS), default="chrome",
+                      help="Browser engine to run searches in")
+    work.add_argument("--max-jobs", type=int, help="Stop after this many jobs")
+    work.add_argument("--stop-when-idle", action="store_true",
+                      help="Exit once the queue is empty")
+    work.add_argument("--rate-limit-state", default=os.environ.get("BOOKING_RATE_LIMIT_STATE"),
+                      help="SQLite file shared by all workers on this host so they draw "
+                           "from one rate limit budget (default: $BOOKING_RATE_LIMIT_STATE)")
+
+    enqueue = commands.add_parser("enqueue", help="Queue searches from a JSON lines file")
+    enqueue.add_argument("jobs_file", help="File with one SearchParameters JSON object per line")
+    enqueue.add_argument("--lane", choices=const.QUEUE_LANES, default=const.QUEUE_LANES[-1])
+
+    report = commands.add_parser("report", help="Write price summary tables of finished searches")
+    report.add_argument("output_dir", help="Directory to write the CSV tables to")
+    report.add_argument("--currency", help="Convert all prices into this currency; "
+                        "without it every table is split by currency")
+    report.add_argument("--rates", help="JSON file mapping currencies to their value in --currency")
+    return parser.parse_args()
+
+
+def enqueue_jobs(broker, jobs_file, lane):
+    with open(jobs_file, encoding="utf-8") as jobs:
+        for line in jobs:
+            if line.strip():
+                job_id = broker.enqueue(SearchParameters.model_validate_json(line), lane)
+                print(job_id)
+
+
+def work(broker, args):
+    browser_service, browser_options = BrowserFactory().prepare_browser(args.browser, detach=False)
+    with Booking(browser_service, browser_options, teardown=True,
+                 browser_type=args.browser,
+                 rate_limiter=get_rate_limiter(args.rate_limit_state)) as booking:
+        SearchWorker(broker, booking).run(args.max_jobs, args.stop_when_idle)
+
+
+def write_report(broker, args):
+    # pandas is only needed for reports, so import it lazily
+    from booking.analytics import price_analytics as analytics
+
+    listings = analytics.listings_frame(broker.finished_results())
+    if args.currency:
+        rates = {}
+        if args.rates:
+            with open(args.rates, encoding="utf-8") as rates_file:
+                rates = json.load(rates_file)
+        listings = analytics.normalize_currency(listings, rates, args.currency)
+    listings = analytics.add_price_per_night(listings)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    tables = {
+        "cheapest_stays": analytics.cheapest_stays(listings),
+        "percentile_bands": analytics.percentile_bands(listings),
+        "price_rating_frontier": analytics.price_rating_frontier(listings),
+    }
+    for name, table in tables.items():
+        table.to_csv(os.path.join(args.output_dir, f"{name}.csv"), index=False)
+    logger.info("Wrote report over %s listings to %s", len(listings), args.output_dir)
+
+
+def main():
+    args = parse_args()
+    configure_logging(getattr(logging, args.log_level))
+    broker = make_broker(args.broker)
+
+    if args.command == "enqueue":
+        enqueue_jobs(broker, args.jobs_file, args.lane)
+    elif args.command == "report":
+        write_report(broker, args)
+    else:
+        try:
+            work(broker, args)
+        except KeyboardInterrupt:
+            logger.info("Worker interrupted by user")
+        except WorkerHalted as e:
+            # Exit non-zero so a supervisor restarts the worker with a fresh browser
+            logger.error("Worker stopped: %s", e)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
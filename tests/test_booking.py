@@ -0,0 +1,89 @@
+from booking.models.search_parameters import SearchParameters
+from booking.services.booking import Booking
+from booking.utils.lookup_cache import LookupCache
+
+SEARCH = SearchParameters(
+    city="Paris",
+    check_in_date="2030-03-10",
+    check_out_date="2030-03-13",
+    num_adults=2,
+    currency="USD",
+)
+
+
+class StubDriver:
+    def maximize_window(self):
+        pass
+
+
+class StubNavigator:
+    """Navigator whose pages show a fixed currency, recording each step taken."""
+
+    def __init__(self, shown_currency):
+        self.shown_currency = shown_currency
+        self.steps = []
+
+    def open_search_results(self, search_params, destination):
+        self.steps.append("open_search_results")
+        return {"listing_count": 3}
+
+    def resolved_destination(self):
+        return {"dest_id": "-1456928", "dest_type": "city"}
+
+    def shows_currency(self, currency):
+        return currency == self.shown_currency
+
+    def go_to_home_page(self, currency=None):
+        self.steps.append(("go_to_home_page", currency))
+
+    def change_currency(self, currency):
+        self.steps.append(("change_currency", currency))
+        self.shown_currency = currency
+
+    def search_city(self, city):
+        self.steps.append("search_city")
+
+    def submit_search(self):
+        self.steps.append("submit_search")
+        return {"listing_count": 3}
+
+
+class StubForm:
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def booking_with(navigator, cache):
+    booking = Booking(driver=StubDriver(), lookup_cache=cache)
+    booking.navigator = navigator
+    booking.date_picker = booking.occupancy_selector = StubForm()
+    return booking
+
+
+def cached_paris():
+    cache = LookupCache()
+    cache.set_destination("Paris", "-1456928", "city")
+    cache.add_currency("USD")
+    return cache
+
+
+def test_cached_results_in_requested_currency_skip_the_form():
+    navigator = StubNavigator(shown_currency="USD")
+    booking_with(navigator, cached_paris()).search_accommodation(SEARCH)
+
+    assert navigator.steps == ["open_search_results"]
+
+
+def test_cached_results_in_other_currency_fall_back_to_the_picker():
+    navigator = StubNavigator(shown_currency="EUR")
+    cache = cached_paris()
+    booking_with(navigator, cache).search_accommodation(SEARCH)
+
+    assert navigator.steps == [
+        "open_search_results",
+        ("go_to_home_page", None),
+        ("change_currency", "USD"),
+        "search_city",
+        "submit_search",
+    ]
+    assert cache.has_currency("USD")
@@ -0,0 +1,158 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from booking.brokers.filesystem_broker import FilesystemBroker
+from booking.brokers.sqlite_broker import SqliteBroker
+from booking.models.search_parameters import SearchParameters
+
+
+def search(city: str, currency=None) -> SearchParameters:
+    return SearchParameters(
+        city=city,
+        check_in_date="2030-03-10",
+        check_out_date="2030-03-13",
+        num_adults=2,
+        currency=currency,
+    )
+
+
+@pytest.fixture(params=["sqlite", "fs"])
+def broker(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteBroker(str(tmp_path / "jobs.db"), max_attempts=2)
+    return FilesystemBroker(str(tmp_path / "queue"), max_attempts=2)
+
+
+def expire(broker):
+    # Reserve with no visibility timeout, so the reservation lapses right away
+    job = broker.reserve(visibility_timeout=0)
+    time.sleep(0.01)
+    return job
+
+
+def test_duplicate_search_returns_pending_job(broker):
+    first = broker.enqueue(search("Paris"))
+    assert broker.enqueue(search(" paris ")) == first
+    assert broker.enqueue(search("Rome")) != first
+
+    reserved = {broker.reserve().id, broker.reserve().id}
+    assert first in reserved
+    assert broker.reserve() is None
+
+
+def test_finished_search_can_be_queued_again(broker):
+    first = broker.enqueue(search("Paris"))
+    broker.ack(broker.reserve(), {"listings": []})
+    assert broker.enqueue(search("Paris")) != first
+
+
+def test_interactive_lane_is_reserved_first(broker):
+    broker.enqueue(search("Paris"), "bulk")
+    broker.enqueue(search("Rome"), "bulk")
+    urgent = broker.enqueue(search("Tokyo"), "interactive")
+
+    job = broker.reserve()
+    assert job.id == urgent
+    assert job.lane == "interactive"
+    assert [broker.reserve().params.city for _ in range(2)] == ["Paris", "Rome"]
+
+
+def test_duplicate_in_more_urgent_lane_is_promoted(broker):
+    broker.enqueue(search("Rome"), "bulk")
+    paris = broker.enqueue(search("Paris"), "bulk")
+    assert broker.enqueue(search("Paris"), "interactive") == paris
+
+    job = broker.reserve()
+    assert job.id == paris
+    assert job.lane == "interactive"
+
+
+def test_duplicate_in_less_urgent_lane_keeps_lane(broker):
+    paris = broker.enqueue(search("Paris"), "interactive")
+    broker.enqueue(search("Paris"), "bulk")
+
+    job = broker.reserve()
+    assert job.id == paris
+    assert job.lane == "interactive"
+
+
+def test_expired_reservation_is_redelivered(broker):
+    broker.enqueue(search("Paris"))
+    first = expire(broker)
+
+    second = broker.reserve()
+    assert second.id == first.id
+    assert second.attempts == 2
+    assert second.receipt != first.receipt
+
+
+def test_expired_reservation_fails_after_max_attempts(broker):
+    broker.enqueue(search("Paris"))
+    expire(broker)
+    expire(broker)
+
+    assert broker.reserve() is None
+
+
+def test_ack_with_stale_receipt_is_ignored(broker):
+    job_id = broker.enqueue(search("Paris"))
+    stale = expire(broker)
+    current = broker.reserve()
+
+    assert broker.ack(stale, {"listings": ["stale"]}) is False
+    assert broker.result(job_id) is None
+    assert broker.ack(current, {"listings": ["fresh"]}) is True
+    assert broker.result(job_id) == {"listings": ["fresh"]}
+    assert list(broker.finished_results()) == [{"listings": ["fresh"]}]
+
+
+def test_release_requeues_until_max_attempts(broker):
+    broker.enqueue(search("Paris"))
+    broker.release(broker.reserve(), "page timed out")
+
+    job = broker.reserve()
+    assert job.attempts == 2
+    broker.release(job, "page timed out")
+    assert broker.reserve() is None
+
+
+def test_sqlite_lock_error_is_not_masked(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobs.db")
+    broker = SqliteBroker(path)
+    monkeypatch.setattr(broker, "_connect", lambda: sqlite3.connect(path, timeout=0, isolation_level=None))
+
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+            broker.enqueue(search("Paris"))
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+
+
+def test_release_without_counting_keeps_attempts(broker):
+    broker.enqueue(search("Paris"))
+    for _ in range(3):
+        broker.release(broker.reserve(), "browser session lost", count_attempt=False)
+
+    job = broker.reserve()
+    assert job.attempts == 1
+
+
+def test_concurrent_duplicates_share_one_job(tmp_path):
+    broker = FilesystemBroker(str(tmp_path / "queue"))
+    for round_ in range(20):
+        barrier = threading.Barrier(8)
+
+        def enqueue():
+            barrier.wait()
+            return broker.enqueue(search(f"Paris {round_}"))
+
+        with ThreadPoolExecutor(8) as pool:
+            job_ids = set(pool.map(lambda _: enqueue(), range(8)))
+        assert len(job_ids) == 1 and "" not in job_ids
+    assert not [name for name in os.listdir(tmp_path / "queue" / "keys") if name.endswith(".tmp")]
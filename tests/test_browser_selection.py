@@ -0,0 +1,74 @@
+import pytest
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from booking.services import booking as booking_module
+from booking.services.booking import Booking
+from booking.utils import browser_factory
+from booking.utils.browser_factory import (
+    BrowserFactory,
+    CHROME_LEAN_ARGUMENTS,
+    FIREFOX_LEAN_PREFERENCES,
+)
+from booking.utils.lookup_cache import LookupCache
+
+
+class FakeDriver:
+    """Stands in for a WebDriver class, remembering how it was started."""
+
+    def __init__(self, service=None, options=None):
+        self.service = service
+        self.options = options
+
+    def maximize_window(self):
+        pass
+
+
+@pytest.fixture
+def driver_managers(monkeypatch, tmp_path):
+    # Point both driver managers at a local file instead of downloading drivers
+    driver_path = tmp_path / "driver"
+    driver_path.write_text("")
+
+    class FakeManager:
+        def install(self):
+            return str(driver_path)
+
+    monkeypatch.setattr(browser_factory, "ChromeDriverManager", FakeManager)
+    monkeypatch.setattr(browser_factory, "GeckoDriverManager", FakeManager)
+    return str(driver_path)
+
+
+def test_firefox_browser_type_starts_firefox(monkeypatch):
+    monkeypatch.setitem(booking_module.DRIVERS, "firefox", FakeDriver)
+    monkeypatch.setitem(booking_module.DRIVERS, "chrome", None)
+
+    booking = Booking("service", "options", browser_type="Firefox", lookup_cache=LookupCache())
+    assert isinstance(booking.driver, FakeDriver)
+    assert (booking.driver.service, booking.driver.options) == ("service", "options")
+
+
+def test_unknown_browser_type_is_rejected():
+    with pytest.raises(ValueError, match="safari"):
+        Booking(browser_type="safari", lookup_cache=LookupCache())
+    with pytest.raises(ValueError, match="safari"):
+        BrowserFactory().prepare_browser("safari")
+
+
+def test_chrome_lean_profile(driver_managers):
+    service, options = BrowserFactory().prepare_browser("chrome", detach=False, headless=True)
+
+    assert isinstance(options, Options)
+    assert service.path == driver_managers
+    assert options.page_load_strategy == "eager"
+    assert "--headless=new" in options.arguments
+    assert set(CHROME_LEAN_ARGUMENTS) <= set(options.arguments)
+
+
+def test_firefox_lean_profile(driver_managers):
+    service, options = BrowserFactory().prepare_browser("firefox", detach=False, headless=True)
+
+    assert isinstance(options, FirefoxOptions)
+    assert service.path == driver_managers
+    assert options.page_load_strategy == "eager"
+    assert "-headless" in options.arguments
+    assert FIREFOX_LEAN_PREFERENCES.items() <= options.preferences.items()
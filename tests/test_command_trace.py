@@ -0,0 +1,195 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import wait as wait_module
+import booking.constants as const
+from booking.models.search_parameters import SearchParameters
+from booking.services.booking import Booking
+from booking.utils.command_trace import CommandTrace, RecordingDriver, ReplayDriver, TraceMismatchError
+from booking.utils.lookup_cache import LookupCache
+from booking.utils.rate_limiter import RateLimiter
+
+HOME_URL = "http://booking.test"
+RESULTS_URL = f"{HOME_URL}{const.SEARCH_RESULTS_PATH}?ss=Paris&dest_id=-1456928&dest_type=city"
+
+SEARCH = SearchParameters(
+    city="Paris",
+    check_in_date="2030-03-10",
+    check_out_date="2030-03-13",
+    num_adults=2,
+    num_children=1,
+    children_ages=[8],
+    currency="USD",
+)
+
+
+class FakeElement(WebElement):
+    def __init__(self, site: "FakeSite", name: str):
+        super().__init__(site, name)
+        self.site = site
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def clear(self):
+        pass
+
+    def send_keys(self, *value):
+        pass
+
+    def click(self):
+        self.site.clicked(self.id)
+
+    def get_attribute(self, name):
+        return str(self.site.counters[self.id])
+
+    def find_element(self, by=By.ID, value=None):
+        return self.site.find_element(by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        if by == By.TAG_NAME:
+            counter = self.id.split(":", 1)[1]
+            return [FakeElement(self.site, f"minus:{counter}"), FakeElement(self.site, f"plus:{counter}")]
+        return self.site.find_elements(by, value)
+
+
+class FakeSite:
+    """Scripted stand-in for the browser, just enough for one search."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.title = "Booking.com"
+        self.page_source = "<html></html>"
+        self.counters = {"group_adults": 2, "group_children": 0}
+        self.search_input_misses = 1
+        self.results_polls = 0
+
+    def maximize_window(self):
+        pass
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        pass
+
+    def clicked(self, name):
+        if name.startswith(("minus:", "plus:")):
+            step, counter = name.split(":", 1)
+            self.counters[counter] += 1 if step == "plus" else -1
+        elif name == "submit":
+            self.current_url = RESULTS_URL
+
+    def find_element(self, by=By.ID, value=None):
+        # The search box renders late, so the first wait poll misses it
+        if value == const.SELECTORS["SEARCH_INPUT"] and self.search_input_misses:
+            self.search_input_misses -= 1
+            raise NoSuchElementException("search input not rendered yet")
+        if by == By.ID:
+            return FakeElement(self, value)
+        if value == "button[type='submit']":
+            return FakeElement(self, "submit")
+        if value.startswith("//input[@id="):
+            counter = value.split('"')[1]
+            return FakeElement(self, f"counter:{counter}")
+        return FakeElement(self, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        if value == const.SELECTORS["KIDS_AGE_SELECT"]:
+            return [FakeElement(self, f"age:{i}") for i in range(self.counters["group_children"])]
+        return []
+
+    def execute_script(self, script, *args):
+        if "__bookingResultsState" not in script:
+            return None
+        # Cards first, then prices, then the listings go quiet
+        self.results_polls += 1
+        return [
+            {"cards": 3, "priced": 0, "empty": False, "quiet": 0},
+            {"cards": 3, "priced": 3, "empty": False, "quiet": 0},
+            {"cards": 3, "priced": 3, "empty": False, "quiet": 1000},
+        ][min(self.results_polls, 3) - 1]
+
+
+def unlimited():
+    return RateLimiter(rate=1000, burst=1000, jitter=0)
+
+
+@pytest.fixture
+def recorded_trace(tmp_path):
+    trace = CommandTrace(metadata={"search_parameters": SEARCH.model_dump()})
+    driver = RecordingDriver(FakeSite(), trace)
+    with Booking(driver=driver, rate_limiter=unlimited(), lookup_cache=LookupCache(),
+                 base_url=HOME_URL) as booking:
+        booking.search_accommodation(SEARCH)
+
+    path = tmp_path / "trace.json"
+    trace.save(str(path))
+    return CommandTrace.load(str(path))
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    def fail(seconds):
+        raise AssertionError(f"replay slept {seconds}s")
+    monkeypatch.setattr(wait_module.time, "sleep", fail)
+
+
+def test_replay_search_exhausts_trace(recorded_trace, no_sleep):
+    driver = ReplayDriver(recorded_trace)
+    with Booking(driver=driver, rate_limiter=unlimited(), lookup_cache=LookupCache(),
+                 base_url=HOME_URL) as booking:
+        metrics = booking.search_accommodation(SEARCH)
+
+    driver.assert_exhausted()
+    assert metrics["listing_count"] == 3
+    counts = recorded_trace.command_counts()
+    assert counts["get"] == 1
+    assert counts["execute_script"] == 5  # three readiness polls and two for the child's age
+    assert counts["find_element"] >= 10
+    snapshots = [entry["command"] for entry in recorded_trace.commands if entry["kind"] == "snapshot"]
+    assert snapshots == ["home_page", "search_form", "search_results"]
+
+
+def test_replay_detects_diverging_commands(recorded_trace, no_sleep):
+    driver = ReplayDriver(recorded_trace)
+    with Booking(driver=driver, rate_limiter=unlimited(), lookup_cache=LookupCache(),
+                 base_url=HOME_URL) as booking:
+        with pytest.raises(TraceMismatchError):
+            # Without children the form is done before the recorded child-age commands
+            booking.search_accommodation(SEARCH.model_copy(update={"num_children": 0, "children_ages": []}))
+
+
+def test_replay_detects_changed_arguments(recorded_trace, no_sleep, monkeypatch):
+    # Same command sequence, only the selector of one wait differs
+    monkeypatch.setitem(const.SELECTORS, "SEARCH_BOX", '[data-testid="searchbox"]')
+    driver = ReplayDriver(recorded_trace)
+    with Booking(driver=driver, rate_limiter=unlimited(), lookup_cache=LookupCache(),
+                 base_url=HOME_URL) as booking:
+        with pytest.raises(TraceMismatchError, match="searchbox"):
+            booking.search_accommodation(SEARCH)
+
+
+def test_replay_detects_changed_url(recorded_trace, no_sleep):
+    driver = ReplayDriver(recorded_trace)
+    with Booking(driver=driver, rate_limiter=unlimited(), lookup_cache=LookupCache(),
+                 base_url="http://staging.booking.test") as booking:
+        with pytest.raises(TraceMismatchError, match="driver.get"):
+            booking.search_accommodation(SEARCH)
+
+
+def test_recorded_wait_timeout_is_replayed(request):
+    trace = CommandTrace()
+    recording = RecordingDriver(FakeSite(), trace)
+    with pytest.raises(TimeoutException):
+        recording.create_wait(0.05, 0.01).until(lambda driver: driver.find_elements(By.ID, "missing"))
+
+    request.getfixturevalue("no_sleep")
+    replay = ReplayDriver(trace)
+    with pytest.raises(TimeoutException):
+        replay.create_wait(0.05, 0.01).until(lambda driver: driver.find_elements(By.ID, "missing"))
+    replay.assert_exhausted()
@@ -0,0 +1,61 @@
+import json
+import logging
+import pytest
+import booking.constants as const
+from booking.utils.logging_config import configure_logging, log_context
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def test_records_carry_correlation_ids(root_logger, tmp_path):
+    log_file = tmp_path / "log.jsonl"
+    listener = configure_logging(logging.INFO, log_file=str(log_file), console=False)
+
+    with log_context(session_id="session-1", search_id="search-1"):
+        logging.getLogger("booking.test").info("Searching %s", "Paris")
+    listener.stop()
+
+    entry = json.loads(log_file.read_text().splitlines()[-1])
+    assert entry["message"] == "Searching Paris"
+    assert (entry["session_id"], entry["search_id"]) == ("session-1", "search-1")
+
+
+def test_listener_can_be_stopped_twice(root_logger):
+    listener = configure_logging(logging.INFO, log_file=None, console=False)
+
+    listener.stop()
+    listener.stop()
+    assert not listener.running
+
+
+def test_reconfiguring_closes_replaced_handlers(root_logger, tmp_path):
+    first = configure_logging(logging.INFO, log_file=str(tmp_path / "first.jsonl"), console=False)
+    first.stop()
+    replaced = list(root_logger.handlers)
+
+    configure_logging(logging.INFO, log_file=None, console=False).stop()
+    assert all(handler not in root_logger.handlers for handler in replaced)
+    assert all(handler._closed for handler in replaced)
+
+
+def test_repeated_debug_messages_are_collapsed(root_logger, tmp_path, monkeypatch):
+    monkeypatch.setitem(const.CONFIG, "LOG_REPEAT_BURST", 2)
+    log_file = tmp_path / "log.jsonl"
+    listener = configure_logging(logging.DEBUG, log_file=str(log_file), console=False)
+
+    for attempt in range(5):
+        logging.getLogger("booking.test").debug("Polling attempt %s", attempt)
+    listener.stop()
+
+    messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+    assert messages == ["Polling attempt 0", "Polling attempt 1"]
@@ -0,0 +1,62 @@
+import threading
+import pytest
+from booking.utils.lookup_cache import LookupCache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    return LookupCache(str(tmp_path / "cache.db") if request.param == "sqlite" else None)
+
+
+def test_entries_round_trip(cache):
+    cache.add_currency("usd")
+    cache.set_destination("New  York ", "20088325", "city")
+
+    assert cache.has_currency("USD")
+    assert not cache.has_currency("EUR")
+    assert cache.get_destination("new york") == {"dest_id": "20088325", "dest_type": "city"}
+
+    cache.forget_currency("USD")
+    cache.forget_destination("New York")
+    assert not cache.has_currency("USD")
+    assert cache.get_destination("new york") is None
+
+
+def test_entries_for_seeds_an_equivalent_cache(cache):
+    cache.add_currency("USD")
+    cache.set_destination("Paris", "-1456928", "city")
+    cache.set_destination("Rome", "-126693", "city")
+
+    seeded = LookupCache(entries=cache.entries_for("paris", "usd"))
+    assert seeded.has_currency("USD")
+    assert seeded.get_destination("Paris") == {"dest_id": "-1456928", "dest_type": "city"}
+    assert seeded.get_destination("Rome") is None
+
+
+def test_processes_sharing_a_file_keep_each_others_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    workers = [LookupCache(path) for _ in range(4)]
+
+    def learn(worker, index):
+        for city in range(25):
+            worker.set_destination(f"city {index}-{city}", str(city), "city")
+
+    threads = [threading.Thread(target=learn, args=(worker, i)) for i, worker in enumerate(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    fresh = LookupCache(path)
+    assert all(
+        fresh.get_destination(f"city {index}-{city}") for index in range(4) for city in range(25)
+    )
+
+
+def test_unusable_file_behaves_as_empty_cache(tmp_path):
+    path = tmp_path / "cache.db"
+    path.write_text("not a database")
+
+    cache = LookupCache(str(path))
+    cache.set_destination("Paris", "-1456928", "city")
+    assert cache.get_destination("Paris") is None
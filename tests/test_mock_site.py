@@ -0,0 +1,34 @@
+import urllib.error
+import urllib.request
+import pytest
+import booking.constants as const
+from booking.utils.mock_site import MockBookingSite
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+def test_serves_home_and_results_pages():
+    with MockBookingSite(listing_count=3) as site:
+        status, content_type, home = fetch(f"{site.base_url}/?selected_currency=USD")
+        assert status == 200
+        assert content_type.startswith("text/html")
+        assert 'name="ss"' in home
+        assert 'data-testid="searchbox-layout-wide"' in home
+        assert const.SEARCH_RESULTS_PATH in home
+
+        status, _, results = fetch(f"{site.base_url}{const.SEARCH_RESULTS_PATH}?ss=Paris")
+        assert status == 200
+        # Cards and prices are rendered by the page's script
+        assert "'property-card'" in results
+        assert "'price-and-discounted-price'" in results
+        assert "i < 3;" in results
+
+
+def test_unknown_paths_are_not_found():
+    with MockBookingSite() as site:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            fetch(f"{site.base_url}/hotel/fr/somewhere.html")
+        assert error.value.code == 404
@@ -0,0 +1,60 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from booking.analytics import price_analytics as analytics
+
+
+def listing(city, price, currency, rating=8.0, check_in="2030-03-10"):
+    return {
+        "city": city,
+        "check_in_date": check_in,
+        "check_out_date": "2030-03-12",
+        "num_adults": 2,
+        "num_children": 0,
+        "name": f"{city} {price}",
+        "price": price,
+        "currency": currency,
+        "rating": rating,
+    }
+
+
+def frame(*listings):
+    return analytics.add_price_per_night(analytics.listings_frame([{"listings": list(listings)}]))
+
+
+def test_summaries_keep_currencies_apart():
+    listings = frame(
+        listing("Paris", 200, "EUR"),
+        listing("Paris", 300, "EUR"),
+        listing("Paris", 20000, "JPY"),
+    )
+
+    cheapest = analytics.cheapest_stays(listings)
+    assert sorted(zip(cheapest["currency"], cheapest["price"])) == [("EUR", 200), ("JPY", 20000)]
+
+    bands = analytics.percentile_bands(listings).set_index("currency")
+    assert bands.loc["EUR", "listings"] == 2
+    assert bands.loc["JPY", "p50"] == 10000
+
+
+def test_normalized_prices_are_compared_together():
+    listings = analytics.listings_frame([{"listings": [
+        listing("Paris", 200, "EUR"), listing("Paris", 20000, "JPY"),
+    ]}])
+    listings = analytics.add_price_per_night(analytics.normalize_currency(listings, {"JPY": 0.006}, "EUR"))
+
+    cheapest = analytics.cheapest_stays(listings)
+    assert len(cheapest) == 1
+    assert cheapest["price"].iloc[0] == pytest.approx(120)
+
+
+def test_frontier_keeps_only_unbeaten_listings():
+    listings = frame(
+        listing("Rome", 100, "EUR", rating=7.0),
+        listing("Rome", 150, "EUR", rating=6.0),
+        listing("Rome", 180, "EUR", rating=9.0),
+    )
+
+    frontier = analytics.price_rating_frontier(listings)
+    assert list(frontier["price"]) == [100, 180]
@@ -0,0 +1,73 @@
+import asyncio
+import sqlite3
+import threading
+import pytest
+from booking.utils import rate_limiter
+from booking.utils.rate_limiter import RateLimiter
+
+
+def test_burst_passes_then_requests_are_paced():
+    limiter = RateLimiter(rate=10, burst=2, jitter=0)
+    delays = [limiter._reserve("booking.test") for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_challenge_page_cuts_the_rate():
+    limiter = RateLimiter(rate=10, burst=1, jitter=0)
+    limiter.record_response("https://booking.test/", 0.1, challenged=True)
+
+    assert limiter._reserve("booking.test") == pytest.approx(0.4, abs=0.01)
+
+
+def test_processes_share_the_budget_through_sqlite(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first = RateLimiter(rate=10, burst=1, jitter=0, state_path=path)
+    second = RateLimiter(rate=10, burst=1, jitter=0, state_path=path)
+
+    assert first._reserve("booking.test") == 0.0
+    assert second._reserve("booking.test") == pytest.approx(0.1, abs=0.01)
+
+
+def test_sqlite_lock_error_is_not_masked(tmp_path, monkeypatch):
+    path = str(tmp_path / "limits.db")
+    limiter = RateLimiter(state_path=path)
+    monkeypatch.setattr(
+        limiter._store, "_connect", lambda: sqlite3.connect(path, timeout=0, isolation_level=None)
+    )
+
+    holder = sqlite3.connect(path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+            limiter.acquire("booking.test")
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+
+
+def test_async_acquire_keeps_sqlite_off_the_event_loop(tmp_path, monkeypatch):
+    limiter = RateLimiter(jitter=0, state_path=str(tmp_path / "limits.db"))
+    update = limiter._store.update
+    threads = []
+
+    def tracked_update(*args):
+        threads.append(threading.current_thread())
+        return update(*args)
+    monkeypatch.setattr(limiter._store, "update", tracked_update)
+
+    assert asyncio.run(limiter.acquire_async("booking.test")) == 0.0
+    assert threads and threading.main_thread() not in threads
+
+
+def test_default_limiter_uses_given_state_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_default_limiter", None)
+    path = str(tmp_path / "limits.db")
+
+    limiter = rate_limiter.get_rate_limiter(path)
+    assert limiter.state_path == path
+    assert rate_limiter.get_rate_limiter() is limiter
+    with pytest.raises(ValueError):
+        rate_limiter.get_rate_limiter(str(tmp_path / "other.db"))
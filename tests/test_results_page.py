@@ -0,0 +1,109 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+import booking.constants as const
+from booking.models.search_parameters import SearchParameters
+from booking.services.results_page import ResultsPage
+
+
+class ScriptedStates:
+    """Driver whose readiness script returns a fixed sequence of page states."""
+
+    def __init__(self, *states):
+        self.states = list(states)
+
+    def execute_script(self, script, *args):
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def state(cards, priced, empty=False, quiet=1000):
+    return {"cards": cards, "priced": priced, "empty": empty, "quiet": quiet}
+
+
+def test_ready_once_cards_and_prices_settle():
+    driver = ScriptedStates(None, state(3, 0, quiet=0), state(3, 3, quiet=0), state(3, 3), state(3, 3))
+    metrics = ResultsPage(driver).wait_until_ready(0.0)
+
+    assert metrics["listing_count"] == 3
+    assert metrics["time_to_first_result"] <= metrics["time_to_ready"]
+
+
+def test_sold_out_cards_without_prices_are_ready():
+    driver = ScriptedStates(state(4, 1), state(4, 1))
+    assert ResultsPage(driver).wait_until_ready(0.0)["listing_count"] == 4
+
+
+def test_cards_waiting_for_prices_are_not_ready(monkeypatch):
+    monkeypatch.setitem(const.CONFIG, "WAIT_TIMEOUT", 0.3)
+    with pytest.raises(TimeoutException):
+        ResultsPage(ScriptedStates(state(25, 0), state(25, 0))).wait_until_ready(0.0)
+
+
+def test_unpriced_cards_with_sold_out_message_are_ready():
+    driver = ScriptedStates(state(2, 0, empty=True), state(2, 0, empty=True))
+    assert ResultsPage(driver).wait_until_ready(0.0)["listing_count"] == 2
+
+
+def test_unpriced_cards_are_ready_after_grace_period():
+    driver = ScriptedStates(state(2, 0, quiet=6000), state(2, 0, quiet=6000))
+    assert ResultsPage(driver).wait_until_ready(0.0)["listing_count"] == 2
+
+
+def test_no_results_page_is_ready_with_no_listings():
+    driver = ScriptedStates(state(0, 0, empty=True), state(0, 0, empty=True))
+    metrics = ResultsPage(driver).wait_until_ready(0.0)
+
+    assert metrics["listing_count"] == 0
+    assert metrics["time_to_first_result"] is None
+
+
+def test_page_without_cards_or_empty_message_times_out(monkeypatch):
+    monkeypatch.setitem(const.CONFIG, "WAIT_TIMEOUT", 0.3)
+    with pytest.raises(TimeoutException):
+        ResultsPage(ScriptedStates(state(0, 0))).wait_until_ready(0.0)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("US$1,234", (1234.0, "USD")),
+    ("€ 250", (250.0, "EUR")),
+    ("USD 99", (99.0, "USD")),
+    ("₪ 480", (480.0, "ILS")),
+    ("$ 80", (80.0, None)),
+])
+def test_price_symbols_map_to_currency_codes(text, expected):
+    amount, symbol = ResultsPage._parse_price(text)
+    assert (amount, ResultsPage._currency_code(symbol)) == expected
+
+
+class ScriptedCards:
+    """Driver whose listings script returns fixed cards."""
+
+    def __init__(self, *prices):
+        self.prices = prices
+
+    def execute_script(self, script, *args):
+        return [{"name": f"Hotel {i}", "price": price, "rating": "8.5"} for i, price in enumerate(self.prices)]
+
+
+def search(currency):
+    return SearchParameters(
+        city="Paris",
+        check_in_date="2030-03-10",
+        check_out_date="2030-03-13",
+        num_adults=2,
+        currency=currency,
+    )
+
+
+def test_listing_currency_comes_from_the_price(caplog):
+    page = ResultsPage(ScriptedCards("€ 250", "$ 80"))
+    with caplog.at_level("WARNING"):
+        listings = page.collect_listings(search("USD"))
+
+    # The site ignored the requested currency; "$" alone is ambiguous
+    assert [listing.currency for listing in listings] == ["EUR", "USD"]
+    assert "Prices are in EUR although USD was requested" in caplog.text
+
+
+def test_unresolved_symbol_is_kept_without_requested_currency():
+    listings = ResultsPage(ScriptedCards("$ 80")).collect_listings(search(None))
+    assert listings[0].currency == "$"
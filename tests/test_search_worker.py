@@ -0,0 +1,88 @@
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from booking.brokers.sqlite_broker import SqliteBroker
+from booking.models.search_parameters import SearchParameters
+from booking.services.search_worker import SearchWorker, WorkerHalted
+
+
+class FlakyBooking:
+    """Booking stand-in whose first search fails with an unexpected error."""
+
+    def __init__(self):
+        self.searches = 0
+        self.driver = type("Driver", (), {"current_url": "http://booking.test/searchresults.html"})()
+
+    def search_accommodation(self, params):
+        self.searches += 1
+        if self.searches == 1:
+            raise IndexError("Child index 0 is out of range")
+        return {"listing_count": 0}
+
+    def collect_listings(self, params):
+        return []
+
+
+def test_unexpected_error_releases_job_and_worker_continues(tmp_path):
+    broker = SqliteBroker(str(tmp_path / "jobs.db"))
+    job_id = broker.enqueue(SearchParameters(
+        city="Paris", check_in_date="2030-03-10", check_out_date="2030-03-13",
+    ))
+
+    booking = FlakyBooking()
+    processed = SearchWorker(broker, booking).run(stop_when_idle=True)
+
+    assert processed == 2
+    assert broker.result(job_id) == {
+        "metrics": {"listing_count": 0},
+        "url": "http://booking.test/searchresults.html",
+        "listings": [],
+    }
+
+
+class FailingBooking(FlakyBooking):
+    """Booking stand-in whose every search fails with the given error."""
+
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+
+    def search_accommodation(self, params):
+        self.searches += 1
+        raise self.error
+
+
+def enqueue_cities(broker, *cities):
+    return [
+        broker.enqueue(SearchParameters(city=city, check_in_date="2030-03-10", check_out_date="2030-03-13"))
+        for city in cities
+    ]
+
+
+@pytest.mark.parametrize("error", [
+    InvalidSessionIdException("invalid session id"),
+    WebDriverException("chrome not reachable"),
+])
+def test_lost_browser_session_stops_worker_without_using_attempts(tmp_path, error):
+    broker = SqliteBroker(str(tmp_path / "jobs.db"))
+    enqueue_cities(broker, "Paris", "Rome")
+
+    booking = FailingBooking(error)
+    with pytest.raises(WorkerHalted):
+        SearchWorker(broker, booking).run(stop_when_idle=True)
+
+    assert booking.searches == 1
+    first = broker.reserve()
+    assert first.params.city == "Paris"
+    assert first.attempts == 1
+
+
+def test_worker_stops_after_consecutive_failures(tmp_path):
+    broker = SqliteBroker(str(tmp_path / "jobs.db"))
+    enqueue_cities(broker, "Paris", "Rome", "Tokyo")
+
+    booking = FailingBooking(ValueError("unexpected page"))
+    with pytest.raises(WorkerHalted):
+        SearchWorker(broker, booking, max_consecutive_failures=2).run(stop_when_idle=True)
+
+    assert booking.searches == 2
+    assert broker.reserve().params.city == "Paris"